@@ -18,13 +18,20 @@ Output is always CSV format, with:
 
 Testing:
   Run tests with: ./run_tests.sh
-  See test_expand_date_ranges.py for 25 comprehensive tests
+  See test_expand_date_ranges.py for 23 comprehensive tests
 """
 
 import csv
+import functools
+import os
+import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import IO, Iterable, List, Optional, Tuple
+
+# Range separator: en-dash or hyphen, with or without surrounding spaces
+_RANGE_SEPARATOR_RE = re.compile(r"\s*[–-]\s*")
 
 
 def parse_date_range(date_str):  # type: ignore[no-untyped-def]
@@ -39,15 +46,8 @@ def parse_date_range(date_str):  # type: ignore[no-untyped-def]
     # Remove commas from date string for easier parsing
     date_str = date_str.replace(",", "")
 
-    # Check if it's a date range
-    if "–" not in date_str and " - " not in date_str and "-" not in date_str:
-        return None
-
-    # Normalize separators (replace en-dash with hyphen)
-    date_str = date_str.replace("–", "-").replace(" - ", "-")
-
-    # Split on the dash
-    parts = date_str.split("-")
+    # Split on the en-dash or hyphen; anything but two parts is not a range
+    parts = _RANGE_SEPARATOR_RE.split(date_str)
     if len(parts) != 2:
         return None
 
@@ -111,10 +111,30 @@ def parse_date_range(date_str):  # type: ignore[no-untyped-def]
     return None
 
 
-def parse_markdown_table(file_path):  # type: ignore[no-untyped-def]
+def _is_path(source: object) -> bool:
+    """
+    Return True if source is a filesystem path rather than an open text stream.
+    """
+    return isinstance(source, (str, os.PathLike))
+
+
+def _source_name(source: object) -> str:
+    """
+    Return a printable name for a path or stream.
+    Streams without a string name (StringIO, SpooledTemporaryFile, files
+    opened from a descriptor) are reported as "<stream>".
+    """
+    if _is_path(source):
+        return str(source)
+    name = getattr(source, "name", None)
+    return name if isinstance(name, str) else "<stream>"
+
+
+def parse_markdown_table(source):  # type: ignore[no-untyped-def]
     """
     Parse all markdown tables and return header and combined rows with region.
     Extracts region from H1 heading (# Region Name) preceding each table.
+    source may be a file path or an open text stream.
     Expected format:
     # Region Name
 
@@ -122,13 +142,20 @@ def parse_markdown_table(file_path):  # type: ignore[no-untyped-def]
     |---------|------|-----------------|
     | ...     | ...  | ...             |
     """
-    with open(file_path, "r") as f:
-        lines = f.readlines()
+    if _is_path(source):
+        with open(source, "r") as f:
+            return _parse_markdown_lines(f)
+    return _parse_markdown_lines(source)
+
 
+def _parse_markdown_lines(lines: Iterable[str]) -> Tuple[List[str], List[Tuple[str, ...]]]:
+    """
+    Parse markdown tables from an iterable of lines. See parse_markdown_table.
+    """
     # Find all tables with their regions
-    all_rows = []
-    header = None
-    table_lines = []
+    all_rows: List[Tuple[str, ...]] = []
+    header: Optional[List[str]] = None
+    table_lines: List[str] = []
     in_table = False
     current_region = "Unknown"
 
@@ -157,7 +184,7 @@ def parse_markdown_table(file_path):  # type: ignore[no-untyped-def]
                     cells = [cell.strip() for cell in table_line.split("|")[1:-1]]
                     if cells and any(cell for cell in cells):
                         # Add region as first column
-                        all_rows.append([current_region] + cells)
+                        all_rows.append((current_region, *cells))
 
             # Reset for next table
             table_lines = []
@@ -173,7 +200,7 @@ def parse_markdown_table(file_path):  # type: ignore[no-untyped-def]
             cells = [cell.strip() for cell in table_line.split("|")[1:-1]]
             if cells and any(cell for cell in cells):
                 # Add region as first column
-                all_rows.append([current_region] + cells)
+                all_rows.append((current_region, *cells))
 
     if not header or not all_rows:
         raise ValueError("No valid markdown table found in file")
@@ -184,27 +211,45 @@ def parse_markdown_table(file_path):  # type: ignore[no-untyped-def]
     return header, all_rows
 
 
-def read_input_file(input_file):  # type: ignore[no-untyped-def]
+def read_input_file(source):  # type: ignore[no-untyped-def]
     """
-    Read input file (CSV or Markdown) and return header and rows.
+    Read input (CSV or Markdown) and return header and rows.
+    source may be a file path (format chosen by suffix) or an open text
+    stream (treated as Markdown unless its name ends in .csv).
     """
-    file_path = Path(input_file)
-
-    if file_path.suffix.lower() == ".md":
-        return parse_markdown_table(input_file)
+    if _is_path(source):
+        is_markdown = Path(source).suffix.lower() == ".md"
     else:
-        # Assume CSV
-        with open(input_file, "r") as f:
-            reader = csv.reader(f)
-            header = next(reader)
-            rows = list(reader)
-        return header, rows
+        is_markdown = Path(_source_name(source)).suffix.lower() != ".csv"
+
+    if is_markdown:
+        return parse_markdown_table(source)
+
+    if _is_path(source):
+        with open(source, "r") as f:
+            return _read_csv_rows(f)
+    return _read_csv_rows(source)
 
 
+def _read_csv_rows(f: Iterable[str]) -> Tuple[List[str], List[Tuple[str, ...]]]:
+    """
+    Read header and rows from an open CSV stream.
+    """
+    reader = csv.reader(f)
+    header = next(reader)
+    # Tuples are smaller than the lists csv.reader yields and are
+    # never mutated downstream
+    rows = [tuple(r) for r in reader]
+    return header, rows
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_date_for_sorting(date_str):  # type: ignore[no-untyped-def]
     """
     Parse a date string to datetime object for sorting.
     Handles various formats like "January 1, 2025", "January 1 2025", etc.
+    Results are memoized: expand_csv_dates parses each date several times
+    (normalize, dedup, sort) and strptime is slow.
     """
     # Remove commas
     date_str_clean = date_str.replace(",", "").strip()
@@ -231,8 +276,12 @@ def expand_csv_dates(input_file, output_file=None):  # type: ignore[no-untyped-d
     """
     Expand date ranges in CSV/Markdown to individual rows.
     Always outputs CSV format, sorted by date ascending.
+    input_file and output_file may each be a path or an open text stream;
+    output_file is required when input_file is a stream.
     """
     if output_file is None:
+        if not _is_path(input_file):
+            raise ValueError("output_file is required when reading from a stream")
         # Generate output filename based on input
         input_path = Path(input_file)
         if input_path.suffix.lower() == ".md":
@@ -253,7 +302,6 @@ def expand_csv_dates(input_file, output_file=None):  # type: ignore[no-untyped-d
         region = row[0]
         holiday = row[1]
         date_str = row[2]
-        row[3] if len(row) > 3 else ""
 
         # Try to parse as date range
         date_range = parse_date_range(date_str)
@@ -267,7 +315,7 @@ def expand_csv_dates(input_file, output_file=None):  # type: ignore[no-untyped-d
                 # Format: "January 1 2025" without leading zero
                 formatted_date = current_date.strftime("%B %-d %Y")
                 day_name = current_date.strftime("%A")
-                expanded_rows.append([region, holiday, formatted_date, day_name])
+                expanded_rows.append((region, holiday, formatted_date, day_name))
                 current_date += timedelta(days=1)
         else:
             # Not a range - parse and reformat to normalize
@@ -275,13 +323,13 @@ def expand_csv_dates(input_file, output_file=None):  # type: ignore[no-untyped-d
             if parsed_date.year != 9999:  # Valid date
                 formatted_date = parsed_date.strftime("%B %-d %Y")
                 day_name = parsed_date.strftime("%A")
-                expanded_rows.append([region, holiday, formatted_date, day_name])
+                expanded_rows.append((region, holiday, formatted_date, day_name))
             else:
                 # Couldn't parse, keep original
                 expanded_rows.append(row)
 
-    # Remove duplicates based on (region, holiday, normalized_date) combination
-    # Normalize dates to a standard format for comparison
+    # Remove duplicates based on (region, holiday, date) combination
+    # Dates are normalized to their ordinal day number for comparison
     seen = set()
     unique_rows = []
     for row in expanded_rows:
@@ -289,14 +337,13 @@ def expand_csv_dates(input_file, output_file=None):  # type: ignore[no-untyped-d
         holiday = row[1]
         date_str = row[2]
 
-        # Parse and normalize the date to YYYY-MM-DD for comparison
         parsed_date = parse_date_for_sorting(date_str)
         if parsed_date.year != 9999:  # Valid date
-            normalized_date = parsed_date.strftime("%Y-%m-%d")
+            normalized_date = parsed_date.toordinal()
         else:
             normalized_date = date_str  # Couldn't parse, use as-is
 
-        key = (region, holiday, normalized_date)  # (region, holiday, normalized_date)
+        key = (region, holiday, normalized_date)
         if key not in seen:
             seen.add(key)
             unique_rows.append(row)
@@ -305,19 +352,29 @@ def expand_csv_dates(input_file, output_file=None):  # type: ignore[no-untyped-d
     unique_rows.sort(key=lambda row: parse_date_for_sorting(row[2]))
 
     # Write output CSV
-    with open(output_file, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(header)
-        writer.writerows(unique_rows)
+    if _is_path(output_file):
+        with open(output_file, "w", newline="") as f:
+            _write_csv_rows(f, header, unique_rows)
+    else:
+        _write_csv_rows(output_file, header, unique_rows)
 
-    print(f"✓ Processed {input_file}")
+    print(f"✓ Processed {_source_name(input_file)}")
     print(f"  Input rows: {len(rows)}")
     print(f"  Expanded rows: {len(expanded_rows)}")
     print(f"  Output rows (after deduplication): {len(unique_rows)}")
     if output_file == input_file:
         print(f"  File updated in place")
     else:
-        print(f"  Output written to: {output_file}")
+        print(f"  Output written to: {_source_name(output_file)}")
+
+
+def _write_csv_rows(f: IO[str], header: List[str], rows: Iterable[Tuple[str, ...]]) -> None:
+    """
+    Write header and rows to an open CSV stream.
+    """
+    writer = csv.writer(f)
+    writer.writerow(header)
+    writer.writerows(rows)
 
 
 def process_directory(directory: str) -> None:
@@ -8,50 +8,64 @@ Run tests:
     python3 -m unittest test_expand_date_ranges         # normal
     python3 -m unittest test_expand_date_ranges -q      # quiet
 
-Test Coverage (25 tests):
-    1. Multi-table markdown parsing (TestMarkdownParsing - 3 tests)
+Test Coverage (23 tests):
+    1. Multi-table markdown parsing (TestMarkdownParsing - 4 tests)
        - Single table parsing
        - Multiple tables in one file
        - Table at end of file without trailing newline
+       - SpooledTemporaryFile input
 
-    2. Date range parsing (TestDateRangeParsing - 5 tests)
-       - Cross-month ranges with/without commas
+    2. Date range parsing (TestDateRangeParsing - 2 tests)
+       - Cross-month ranges with/without commas (table-driven)
        - Same-month ranges (abbreviated and full month names)
        - Single dates (not ranges)
 
-    3. Date normalization (TestDateNormalization - 4 tests)
+    3. Date normalization (TestDateNormalization - 2 tests)
        - Dates with commas vs. without
        - Abbreviated vs. full month names
        - Proper chronological sorting
 
-    4. Deduplication (TestDeduplication - 3 tests)
-       - Duplicate dates with different format strings
-       - Different holidays on same date (both kept)
+    4. Deduplication (TestDeduplication - 1 test)
        - Deduplication across multiple tables
 
-    5. Date range expansion (TestDateRangeExpansion - 2 tests)
-       - Range expansion to individual dates
+    5. Date range expansion (TestDateRangeExpansion - 1 test)
        - Overlapping ranges with deduplication
 
-    6. Edge cases (TestEdgeCases - 6 tests)
+    6. Expansion cases (TestExpansionCases - 1 table-driven test)
+       - Duplicate dates with different format strings
+       - Different holidays on same date (both kept)
+       - Range expansion to individual dates
+       - En-dash vs hyphen in date ranges
+
+    7. Edge cases (TestEdgeCases - 5 tests)
        - Same holiday name on different dates
        - Cross-year date handling
-       - En-dash vs hyphen in date ranges
        - Date ranges with no spaces around dash
        - Multiple consecutive entries with same holiday name
        - Mixed date formats within same table
 
-    7. Sorting (TestSorting - 1 test)
+    8. Sorting (TestSorting - 1 test)
        - Output sorted in chronological order
 
-    8. Integration (TestIntegration - 1 test)
-       - Realistic multi-region holiday data
-       - All features working together
+    9. Integration (TestIntegration - 3 tests)
+       - Realistic multi-region holiday data, expanded once per class
+       - Row count, key holidays, unique (region, holiday, date) rows
+
+    10. File paths (TestFilePaths - 3 tests)
+       - Markdown parsing from a path
+       - Expansion to an explicit output path
+       - Default .md -> .csv output path
 """
 
+import collections
+import contextlib
+import csv
+import io
 import os
+import shutil
 import tempfile
 import unittest
+from collections.abc import Iterator
 
 from expand_date_ranges import (
     expand_csv_dates,
@@ -61,6 +75,96 @@ from expand_date_ranges import (
 )
 
 
+@contextlib.contextmanager
+def run_expand(content: str) -> Iterator[list[str]]:
+    """Expand markdown content in memory and yield the output CSV lines."""
+    output_io = io.StringIO()
+    expand_csv_dates(io.StringIO(content), output_io)
+    yield output_io.getvalue().splitlines(keepends=True)
+
+
+def setUpModule() -> None:
+    """Prime parsing state so the first test's timing reflects steady-state cost."""
+    parse_date_range("Jan 1-2 2000")
+    parse_date_for_sorting("January 1 2000")
+
+
+# Markdown fixtures shared by the in-memory tests and TestFilePaths
+FIXTURES = {
+    "dup_formats": """
+# Holidays
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| New Year | January 1, 2025 | Wednesday |
+| New Year | January 1 2025 | Wednesday |
+""",
+    "same_date_holidays": """
+# Holidays
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| Christmas | December 25, 2025 | Thursday |
+| Company Shutdown | December 25 2025 | Thursday |
+""",
+    "across_tables": """
+# USA Holidays
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| Independence Day | July 4, 2025 | Friday |
+| Shutdown | December 26, 2025 | Friday |
+
+# India Holidays
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| Independence Day | August 15, 2025 | Friday |
+| Shutdown | December 26 2025 | Friday |
+""",
+    "dash_styles": """
+# Holidays
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| Break A | Jun 30 – Jul 3, 2025 | Mon to Thu |
+| Break B | Dec 25-31, 2025 | Thu-Wed |
+""",
+    "july_break": """
+# Holidays
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| July 4th Break | Jun 30 – Jul 3, 2025 | Mon to Thu |
+""",
+}
+
+# Pre-encoded once for TestFilePaths, which writes fixtures in binary mode
+FIXTURES_BYTES = {name: content.encode("utf-8") for name, content in FIXTURES.items()}
+
+# Realistic multi-region data for TestIntegration
+INTEGRATION_MD = """
+# United States
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| New Year's Day | January 1, 2025 | Wednesday |
+| July 4th Break | Jun 30 – Jul 3, 2025 | Mon to Thu |
+| Independence Day | July 4, 2025 | Friday |
+| Christmas Day | December 25, 2025 | Thursday |
+| Company Shutdown | December 26, 2025 | Friday |
+| Company Shutdown | December 29, 2025 | Monday |
+
+# India
+
+| Holiday | Date | Day of the Week |
+|---------|------|-----------------|
+| Independence Day | August 15, 2025 | Friday |
+| Diwali | October 20, 2025 | Monday |
+| Company Shutdown | December 25–31, 2025 | Thursday–Wednesday |
+"""
+
+
 class TestMarkdownParsing(unittest.TestCase):
     """Test parsing of multiple markdown tables."""
 
@@ -74,20 +178,13 @@ class TestMarkdownParsing(unittest.TestCase):
 | New Year | January 1, 2025 | Wednesday |
 | MLK Day | January 20, 2025 | Monday |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        try:
-            header, rows = parse_markdown_table(temp_file)
-            self.assertEqual(header, ["Region", "Holiday", "Date", "Day of the Week"])
-            self.assertEqual(len(rows), 2)
-            self.assertEqual(rows[0][0], "United States")  # Region
-            self.assertEqual(rows[0][1], "New Year")  # Holiday
-            self.assertEqual(rows[1][0], "United States")  # Region
-            self.assertEqual(rows[1][1], "MLK Day")  # Holiday
-        finally:
-            os.unlink(temp_file)
+        header, rows = parse_markdown_table(io.StringIO(content))
+        self.assertEqual(header, ["Region", "Holiday", "Date", "Day of the Week"])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][0], "United States")  # Region
+        self.assertEqual(rows[0][1], "New Year")  # Holiday
+        self.assertEqual(rows[1][0], "United States")  # Region
+        self.assertEqual(rows[1][1], "MLK Day")  # Holiday
 
     def test_multiple_tables(self) -> None:
         """Test parsing multiple markdown tables from one file."""
@@ -108,27 +205,17 @@ Some text between tables.
 | Diwali | October 20, 2025 | Monday |
 | Gandhi Jayanthi | October 2, 2025 | Thursday |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        try:
-            header, rows = parse_markdown_table(temp_file)
-            self.assertEqual(header, ["Region", "Holiday", "Date", "Day of the Week"])
-            # Should have all 4 rows from both tables
-            self.assertEqual(len(rows), 4)
-            # Check regions
-            regions = [row[0] for row in rows]
-            self.assertEqual(regions.count("USA Holidays"), 2)
-            self.assertEqual(regions.count("India Holidays"), 2)
-            # Check holiday names (now in column 1)
-            holiday_names = [row[1] for row in rows]
-            self.assertIn("New Year", holiday_names)
-            self.assertIn("MLK Day", holiday_names)
-            self.assertIn("Diwali", holiday_names)
-            self.assertIn("Gandhi Jayanthi", holiday_names)
-        finally:
-            os.unlink(temp_file)
+        header, rows = parse_markdown_table(io.StringIO(content))
+        self.assertEqual(header, ["Region", "Holiday", "Date", "Day of the Week"])
+        # Should have all 4 rows from both tables
+        self.assertEqual(len(rows), 4)
+        # Check regions
+        regions = [row[0] for row in rows]
+        self.assertEqual(regions.count("USA Holidays"), 2)
+        self.assertEqual(regions.count("India Holidays"), 2)
+        # Check holiday names (now in column 1)
+        holiday_names = [row[1] for row in rows]
+        self.assertCountEqual(holiday_names, ["New Year", "MLK Day", "Diwali", "Gandhi Jayanthi"])
 
     def test_table_at_end_of_file(self) -> None:
         """Test parsing when table is at the end of file (no newline after)."""
@@ -138,59 +225,52 @@ Some text between tables.
 | Holiday | Date | Day of the Week |
 |---------|------|-----------------|
 | New Year | January 1, 2025 | Wednesday |"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        try:
-            header, rows = parse_markdown_table(temp_file)
-            self.assertEqual(len(rows), 1)
-            self.assertEqual(rows[0][0], "Holidays")  # Region
-            self.assertEqual(rows[0][1], "New Year")  # Holiday
-        finally:
-            os.unlink(temp_file)
+        header, rows = parse_markdown_table(io.StringIO(content))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][0], "Holidays")  # Region
+        self.assertEqual(rows[0][1], "New Year")  # Holiday
+
+    def test_spooled_tempfile_input(self) -> None:
+        """Test parsing from a SpooledTemporaryFile, which has no string name."""
+        with tempfile.SpooledTemporaryFile(max_size=64 * 1024, mode="w+") as f:
+            f.write(FIXTURES["across_tables"])
+            f.seek(0)
+            header, rows = parse_markdown_table(f)
+        self.assertEqual(header, ["Region", "Holiday", "Date", "Day of the Week"])
+        self.assertEqual(len(rows), 4)
+
+
+# (input, (start month, start day, end month, end day, year))
+RANGE_CASES = [
+    # Cross-month range with comma
+    ("Jun 30 – Jul 3, 2025", (6, 30, 7, 3, 2025)),
+    # Cross-month range without comma
+    ("Jun 30 – Jul 3 2025", (6, 30, 7, 3, 2025)),
+    # Same-month range, abbreviated month
+    ("Dec 28-31 2026", (12, 28, 12, 31, 2026)),
+    # Same-month range, full month name
+    ("July 6-10 2026", (7, 6, 7, 10, 2026)),
+]
+
+# (input, (year, month, day))
+DATE_CASES = [
+    ("January 1, 2025", (2025, 1, 1)),  # With comma
+    ("January 1 2025", (2025, 1, 1)),  # Without comma
+    ("Dec 25 2025", (2025, 12, 25)),  # Abbreviated month
+]
 
 
 class TestDateRangeParsing(unittest.TestCase):
     """Test parsing of date ranges in various formats."""
 
-    def test_cross_month_range_with_comma(self) -> None:
-        """Test parsing cross-month range like 'Jun 30 – Jul 3, 2025'."""
-        result = parse_date_range("Jun 30 – Jul 3, 2025")
-        self.assertIsNotNone(result)
-        start, end = result
-        self.assertEqual(start.month, 6)
-        self.assertEqual(start.day, 30)
-        self.assertEqual(end.month, 7)
-        self.assertEqual(end.day, 3)
-        self.assertEqual(start.year, 2025)
-
-    def test_cross_month_range_without_comma(self) -> None:
-        """Test parsing cross-month range like 'Jun 30 – Jul 3 2025'."""
-        result = parse_date_range("Jun 30 – Jul 3 2025")
-        self.assertIsNotNone(result)
-        start, end = result
-        self.assertEqual(start.month, 6)
-        self.assertEqual(end.month, 7)
-
-    def test_same_month_range_abbreviated(self) -> None:
-        """Test parsing same-month range like 'Dec 28-31 2026'."""
-        result = parse_date_range("Dec 28-31 2026")
-        self.assertIsNotNone(result)
-        start, end = result
-        self.assertEqual(start.month, 12)
-        self.assertEqual(start.day, 28)
-        self.assertEqual(end.month, 12)
-        self.assertEqual(end.day, 31)
-
-    def test_same_month_range_full_name(self) -> None:
-        """Test parsing same-month range like 'July 6-10 2026'."""
-        result = parse_date_range("July 6-10 2026")
-        self.assertIsNotNone(result)
-        start, end = result
-        self.assertEqual(start.month, 7)
-        self.assertEqual(start.day, 6)
-        self.assertEqual(end.day, 10)
+    def test_parse_date_range(self) -> None:
+        """Test parsing cross-month and same-month ranges from RANGE_CASES."""
+        for date_str, expected in RANGE_CASES:
+            with self.subTest(date_str=date_str):
+                result = parse_date_range(date_str)
+                self.assertIsNotNone(result)
+                start, end = result
+                self.assertEqual((start.month, start.day, end.month, end.day, start.year), expected)
 
     def test_single_date_not_a_range(self) -> None:
         """Test that single dates are not parsed as ranges."""
@@ -204,26 +284,12 @@ class TestDateRangeParsing(unittest.TestCase):
 class TestDateNormalization(unittest.TestCase):
     """Test date parsing and normalization."""
 
-    def test_parse_date_with_comma(self) -> None:
-        """Test parsing dates with commas like 'January 1, 2025'."""
-        result = parse_date_for_sorting("January 1, 2025")
-        self.assertEqual(result.year, 2025)
-        self.assertEqual(result.month, 1)
-        self.assertEqual(result.day, 1)
-
-    def test_parse_date_without_comma(self) -> None:
-        """Test parsing dates without commas like 'January 1 2025'."""
-        result = parse_date_for_sorting("January 1 2025")
-        self.assertEqual(result.year, 2025)
-        self.assertEqual(result.month, 1)
-        self.assertEqual(result.day, 1)
-
-    def test_parse_abbreviated_month(self) -> None:
-        """Test parsing abbreviated month like 'Dec 25 2025'."""
-        result = parse_date_for_sorting("Dec 25 2025")
-        self.assertEqual(result.year, 2025)
-        self.assertEqual(result.month, 12)
-        self.assertEqual(result.day, 25)
+    def test_parse_date_for_sorting(self) -> None:
+        """Test parsing dates with/without commas and abbreviated months from DATE_CASES."""
+        for date_str, expected in DATE_CASES:
+            with self.subTest(date_str=date_str):
+                result = parse_date_for_sorting(date_str)
+                self.assertEqual((result.year, result.month, result.day), expected)
 
     def test_dates_sort_correctly(self) -> None:
         """Test that dates sort in chronological order."""
@@ -243,100 +309,9 @@ class TestDateNormalization(unittest.TestCase):
 class TestDeduplication(unittest.TestCase):
     """Test deduplication with normalized dates."""
 
-    def test_duplicate_dates_with_different_formats(self) -> None:
-        """Test that duplicate dates with different formats are deduplicated."""
-        content = """
-# Holidays
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| New Year | January 1, 2025 | Wednesday |
-| New Year | January 1 2025 | Wednesday |
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
-            # Should have header + 1 data row (duplicate removed)
-            self.assertEqual(len(lines), 2)
-            self.assertIn("New Year", lines[1])
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
-
-    def test_keep_different_holidays_same_date(self) -> None:
-        """Test that different holidays on the same date are both kept."""
-        content = """
-# Holidays
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| Christmas | December 25, 2025 | Thursday |
-| Company Shutdown | December 25 2025 | Thursday |
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
-            # Should have header + 2 data rows (both kept)
-            self.assertEqual(len(lines), 3)
-            content = "".join(lines)
-            self.assertIn("Christmas", content)
-            self.assertIn("Company Shutdown", content)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
-
     def test_deduplication_across_tables(self) -> None:
         """Test deduplication works across multiple tables."""
-        content = """
-# USA Holidays
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| Independence Day | July 4, 2025 | Friday |
-| Shutdown | December 26, 2025 | Friday |
-
-# India Holidays
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| Independence Day | August 15, 2025 | Friday |
-| Shutdown | December 26 2025 | Friday |
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
+        with run_expand(FIXTURES["across_tables"]) as lines:
             # Should have header + 4 rows (with Region column, different regions are kept):
             # - Independence Day (July 4) from USA
             # - Independence Day (August 15) from India
@@ -344,56 +319,19 @@ class TestDeduplication(unittest.TestCase):
             # - Shutdown (Dec 26) from India (both kept, different regions)
             self.assertEqual(len(lines), 5)
 
-            # Check content
-            content = "".join(lines)
-            self.assertIn("July 4", content)
-            self.assertIn("August 15", content)
+            # Count rows per date from the parsed Date column
+            reader = csv.reader(lines)
+            date_col = next(reader).index("Date")
+            dates = collections.Counter(row[date_col] for row in reader)
+            self.assertEqual(dates["July 4 2025"], 1)
+            self.assertEqual(dates["August 15 2025"], 1)
             # Should have TWO December 26 entries (one per region)
-            december_count = content.count("December 26")
-            self.assertEqual(december_count, 2)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+            self.assertEqual(dates["December 26 2025"], 2)
 
 
 class TestDateRangeExpansion(unittest.TestCase):
     """Test expansion of date ranges."""
 
-    def test_expand_date_range(self) -> None:
-        """Test that date ranges are expanded to individual dates."""
-        content = """
-# Holidays
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| July 4th Break | Jun 30 – Jul 3, 2025 | Mon to Thu |
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
-            # Should have header + 4 data rows (June 30, July 1, 2, 3)
-            self.assertEqual(len(lines), 5)
-            content = "".join(lines)
-            self.assertIn("June 30", content)
-            self.assertIn("July 1", content)
-            self.assertIn("July 2", content)
-            self.assertIn("July 3", content)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
-
     def test_expand_and_deduplicate_range_with_overlap(self) -> None:
         """Test that overlapping date ranges are properly deduplicated."""
         content = """
@@ -405,35 +343,53 @@ class TestDateRangeExpansion(unittest.TestCase):
 | Shutdown | December 26, 2025 | Friday |
 | Shutdown | Dec 25–31, 2025 | Thu–Wed |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
+        with run_expand(content) as lines:
             # Should have header + 7 rows (Dec 25-31, no duplicates)
             self.assertEqual(len(lines), 8)
 
-            # Verify all dates from 25-31 are present
-            content = "".join(lines)
-            for day in range(25, 32):
-                self.assertIn(f"December {day}", content)
-
-            # Count occurrences - each date should appear exactly once
+            # Each date from 25-31 should appear exactly once
+            reader = csv.reader(lines)
+            date_col = next(reader).index("Date")
+            dates = collections.Counter(row[date_col] for row in reader)
             for day in range(25, 32):
-                count = content.count(f"December {day}")
-                self.assertEqual(count, 1, f"December {day} should appear exactly once")
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+                self.assertEqual(
+                    dates[f"December {day} 2025"], 1, f"December {day} should appear exactly once"
+                )
+
+
+# (name, fixture, expected line count including header, cell values expected in output)
+EXPANSION_CASES = [
+    # Duplicate dates with different formats collapse to one row
+    ("duplicate_formats", "dup_formats", 2, {"New Year", "January 1 2025"}),
+    # Different holidays on the same date are both kept
+    ("different_holidays_same_date", "same_date_holidays", 3, {"Christmas", "Company Shutdown"}),
+    # Range expands to June 30, July 1, 2, 3
+    (
+        "expand_date_range",
+        "july_break",
+        5,
+        {"June 30 2025", "July 1 2025", "July 2 2025", "July 3 2025"},
+    ),
+    # En-dash and hyphen ranges: 4 (Jun 30-Jul 3) + 7 (Dec 25-31)
+    (
+        "en_dash_vs_hyphen",
+        "dash_styles",
+        12,
+        {"June 30 2025", "July 3 2025", "December 25 2025", "December 31 2025"},
+    ),
+]
+
+
+class TestExpansionCases(unittest.TestCase):
+    """Table-driven expansion checks, one subTest per fixture."""
+
+    def test_expand_cases(self) -> None:
+        """Test row counts and expected content for each expansion case."""
+        for name, fixture, expected_lines, expected_cells in EXPANSION_CASES:
+            with self.subTest(name=name), run_expand(FIXTURES[fixture]) as lines:
+                self.assertEqual(len(lines), expected_lines)
+                cells = {cell for row in csv.reader(lines) for cell in row}
+                self.assertLessEqual(expected_cells, cells)
 
 
 class TestSorting(unittest.TestCase):
@@ -451,34 +407,16 @@ class TestSorting(unittest.TestCase):
 | July 4th | July 4, 2025 | Friday |
 | MLK Day | January 20, 2025 | Monday |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()[1:]  # Skip header
-
-            # Extract dates and verify they're in order
-            dates = []
-            for line in lines:
-                # Extract date (second column)
-                parts = line.split(",")
-                date_str = parts[1].strip().strip('"')
-                dates.append(parse_date_for_sorting(date_str))
+        with run_expand(content) as lines:
+            # Extract dates from the Date column and verify they're in order
+            reader = csv.reader(lines)
+            date_col = next(reader).index("Date")
+            dates = [parse_date_for_sorting(row[date_col]) for row in reader]
+            self.assertEqual(len(dates), 4)
 
             # Verify dates are in ascending order
             for i in range(len(dates) - 1):
                 self.assertLessEqual(dates[i], dates[i + 1], f"Dates not in order at position {i}")
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
 
 
 class TestEdgeCases(unittest.TestCase):
@@ -494,31 +432,14 @@ class TestEdgeCases(unittest.TestCase):
 | Independence Day | July 4, 2025 | Friday |
 | Independence Day | August 15, 2025 | Friday |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
+        with run_expand(content) as lines:
             # Should have header + 2 rows (both Independence Days kept)
             self.assertEqual(len(lines), 3)
-            content = "".join(lines)
-            self.assertIn("July 4", content)
-            self.assertIn("August 15", content)
+            self.assertTrue(any("July 4" in line for line in lines))
+            self.assertTrue(any("August 15" in line for line in lines))
             # Count occurrences of Independence Day
-            independence_count = content.count("Independence Day")
+            independence_count = sum(line.count("Independence Day") for line in lines)
             self.assertEqual(independence_count, 2)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
 
     def test_cross_year_dates(self) -> None:
         """Test handling dates that cross calendar years."""
@@ -531,19 +452,7 @@ class TestEdgeCases(unittest.TestCase):
 | Christmas | December 25, 2025 | Thursday |
 | New Year's Day | January 1, 2026 | Thursday |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
+        with run_expand(content) as lines:
             # Should have header + 3 rows, sorted chronologically
             self.assertEqual(len(lines), 4)
             # First data row should be Jan 1, 2025
@@ -552,46 +461,6 @@ class TestEdgeCases(unittest.TestCase):
             self.assertIn("December 25 2025", lines[2])
             # Third should be Jan 1, 2026
             self.assertIn("January 1 2026", lines[3])
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
-
-    def test_en_dash_vs_hyphen_ranges(self) -> None:
-        """Test date ranges with en-dash (–) vs hyphen (-)."""
-        content = """
-# Holidays
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| Break A | Jun 30 – Jul 3, 2025 | Mon to Thu |
-| Break B | Dec 25-31, 2025 | Thu-Wed |
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
-            # Should expand both ranges: 4 (Jun 30-Jul 3) + 7 (Dec 25-31) = 11 + header
-            self.assertEqual(len(lines), 12)
-            content = "".join(lines)
-            # Verify both ranges expanded
-            self.assertIn("June 30", content)
-            self.assertIn("July 3", content)
-            self.assertIn("December 25", content)
-            self.assertIn("December 31", content)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
 
     def test_multiple_consecutive_same_holiday(self) -> None:
         """Test multiple consecutive entries with same holiday name."""
@@ -605,29 +474,12 @@ class TestEdgeCases(unittest.TestCase):
 | Company Shutdown | December 28, 2025 | Sunday |
 | Company Shutdown | December 29, 2025 | Monday |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
+        with run_expand(content) as lines:
             # Should have header + 4 rows (all kept, no deduplication)
             self.assertEqual(len(lines), 5)
-            content = "".join(lines)
             # All should be Company Shutdown
-            shutdown_count = content.count("Company Shutdown")
+            shutdown_count = sum(line.count("Company Shutdown") for line in lines)
             self.assertEqual(shutdown_count, 4)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
 
     def test_mixed_date_formats_in_table(self) -> None:
         """Test table with mixed date formats (full month, abbreviated, with/without commas)."""
@@ -641,42 +493,32 @@ class TestEdgeCases(unittest.TestCase):
 | Holiday C | March 17, 2025 | Monday |
 | Holiday D | Apr 1 2025 | Tuesday |
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
+        with run_expand(content) as lines:
             # Should have header + 4 rows, all normalized to same format
             self.assertEqual(len(lines), 5)
 
             # All dates should be normalized (no commas in output)
-            content = "".join(lines)
-            self.assertIn("January 1 2025", content)
-            self.assertIn("February 14 2025", content)  # Expanded from "Feb"
-            self.assertIn("March 17 2025", content)
-            self.assertIn("April 1 2025", content)  # Expanded from "Apr"
-
-            # Verify chronological order by checking line order
-            jan_line = next(i for i, line in enumerate(lines) if "January" in line)
-            feb_line = next(i for i, line in enumerate(lines) if "February" in line)
-            mar_line = next(i for i, line in enumerate(lines) if "March" in line)
-            apr_line = next(i for i, line in enumerate(lines) if "April" in line)
-
-            self.assertLess(jan_line, feb_line)
-            self.assertLess(feb_line, mar_line)
-            self.assertLess(mar_line, apr_line)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+            reader = csv.reader(lines)
+            date_col = next(reader).index("Date")
+            dates = {row[date_col] for row in reader}
+            # "Feb" and "Apr" are expanded to full month names
+            self.assertEqual(
+                dates, {"January 1 2025", "February 14 2025", "March 17 2025", "April 1 2025"}
+            )
+
+            # Verify chronological order by recording each month's first line in one pass
+            months = ("January", "February", "March", "April")
+            positions: dict[str, int] = {}
+            for i, line in enumerate(lines):
+                for month in months:
+                    if month in line and month not in positions:
+                        positions[month] = i
+                if len(positions) == len(months):
+                    break
+
+            self.assertLess(positions["January"], positions["February"])
+            self.assertLess(positions["February"], positions["March"])
+            self.assertLess(positions["March"], positions["April"])
 
     def test_date_range_no_spaces_around_dash(self) -> None:
         """Test date range with no spaces around dash: 'December 25–31, 2025'."""
@@ -691,73 +533,87 @@ class TestEdgeCases(unittest.TestCase):
 
 
 class TestIntegration(unittest.TestCase):
-    """Integration tests with realistic data."""
-
-    def test_realistic_multi_region_holidays(self) -> None:
-        """Test with realistic multi-region holiday data."""
-        content = """
-# United States
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| New Year's Day | January 1, 2025 | Wednesday |
-| July 4th Break | Jun 30 – Jul 3, 2025 | Mon to Thu |
-| Independence Day | July 4, 2025 | Friday |
-| Christmas Day | December 25, 2025 | Thursday |
-| Company Shutdown | December 26, 2025 | Friday |
-| Company Shutdown | December 29, 2025 | Monday |
-
-# India
-
-| Holiday | Date | Day of the Week |
-|---------|------|-----------------|
-| Independence Day | August 15, 2025 | Friday |
-| Diwali | October 20, 2025 | Monday |
-| Company Shutdown | December 25–31, 2025 | Thursday–Wednesday |
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
-
-        output_file = temp_file.replace(".md", ".csv")
-
-        try:
-            expand_csv_dates(temp_file, output_file)
-
-            # Read the output
-            with open(output_file, "r") as f:
-                lines = f.readlines()
-
-            # Verify we have expected number of rows (with Region column):
-            # USA: 1 (New Year) + 4 (July Break) + 1 (July 4) + 1 (Christmas) + 1 (Dec 26) + 1 (Dec 29) = 9
-            # India: 1 (Aug 15) + 1 (Diwali) + 7 (Dec 25-31) = 9
-            # With regions, different regions are NOT duplicates
-            # Both USA and India have Company Shutdown on Dec 26, 29
-            # So total: 9 + 9 = 18 data rows + header = 19 lines
-            self.assertEqual(len(lines), 19)
-
-            content = "".join(lines)
-
-            # Verify key holidays are present
-            self.assertIn("New Year's Day", content)
-            self.assertIn("July 4th Break", content)
-            self.assertIn("Diwali", content)
-
-            # Verify (region, holiday, date) combinations are unique
-            combinations: set[tuple[str, str, str]] = set()
-            for line in lines[1:]:  # Skip header
-                parts = line.split(",")
-                region = parts[0].strip().strip('"')
-                holiday = parts[1].strip().strip('"')
-                date_str = parts[2].strip().strip('"')
-                combo = (region, holiday, date_str)
-                # Each (region, holiday, date) combo should be unique
-                self.assertNotIn(combo, combinations, f"Duplicate: {combo}")
-                combinations.add(combo)
-        finally:
-            os.unlink(temp_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+    """Integration tests with realistic data, expanded once per class."""
+
+    integration_rows: list[list[str]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with run_expand(INTEGRATION_MD) as lines:
+            cls.integration_rows = list(csv.reader(lines))
+
+    def test_integration_row_count(self) -> None:
+        """Test the expected number of rows for multi-region holiday data."""
+        # Verify we have expected number of rows (with Region column):
+        # USA: 1 (New Year) + 4 (July Break) + 1 (July 4) + 1 (Christmas) + 1 (Dec 26) + 1 (Dec 29) = 9
+        # India: 1 (Aug 15) + 1 (Diwali) + 7 (Dec 25-31) = 9
+        # With regions, different regions are NOT duplicates
+        # Both USA and India have Company Shutdown on Dec 26, 29
+        # So total: 9 + 9 = 18 data rows + header = 19 lines
+        self.assertEqual(len(self.integration_rows), 19)
+
+    def test_integration_key_holidays_present(self) -> None:
+        """Test that key holidays survive expansion and deduplication."""
+        holidays = {row[1] for row in self.integration_rows[1:]}
+        self.assertLessEqual({"New Year's Day", "July 4th Break", "Diwali"}, holidays)
+
+    def test_integration_combinations_unique(self) -> None:
+        """Test that each (region, holiday, date) combination appears once."""
+        combinations: set[tuple[str, str, str]] = set()
+        for row in self.integration_rows[1:]:  # Skip header
+            combo = (row[0], row[1], row[2])
+            # Each (region, holiday, date) combo should be unique
+            self.assertNotIn(combo, combinations, f"Duplicate: {combo}")
+            combinations.add(combo)
+
+
+class TestFilePaths(unittest.TestCase):
+    """Test path-based input and output against fixtures written once per class."""
+
+    _tmpdir: str
+    _fixtures: dict[str, str]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmpdir = tempfile.mkdtemp()
+        cls._fixtures = {}
+        for name, content in FIXTURES_BYTES.items():
+            path = os.path.join(cls._tmpdir, f"{name}.md")
+            with open(path, "wb") as f:
+                f.write(content)
+            cls._fixtures[name] = path
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._tmpdir)
+
+    def test_parse_markdown_table_from_path(self) -> None:
+        """Test parsing a markdown table given a file path."""
+        header, rows = parse_markdown_table(self._fixtures["across_tables"])
+        self.assertEqual(header, ["Region", "Holiday", "Date", "Day of the Week"])
+        self.assertEqual(len(rows), 4)
+
+    def test_expand_to_explicit_output_path(self) -> None:
+        """Test expanding a markdown file to an explicit CSV path."""
+        output_file = os.path.join(self._tmpdir, "july_break_expanded.csv")
+        expand_csv_dates(self._fixtures["july_break"], output_file)
+
+        with open(output_file, "r") as f:
+            line_count = sum(1 for _ in f)
+
+        # Header + June 30, July 1, 2, 3
+        self.assertEqual(line_count, 5)
+
+    def test_expand_to_default_output_path(self) -> None:
+        """Test that markdown input defaults to a sibling .csv output."""
+        expand_csv_dates(self._fixtures["dup_formats"])
+
+        output_file = os.path.join(self._tmpdir, "dup_formats.csv")
+        with open(output_file, "r") as f:
+            line_count = sum(1 for _ in f)
+
+        # Header + 1 data row (duplicate removed)
+        self.assertEqual(line_count, 2)
 
 
 if __name__ == "__main__":
@@ -71,16 +71,18 @@ EXAMPLES:
     $(basename "$0") TestEdgeCases -v         # Run edge case tests verbosely
 
 AVAILABLE TEST CLASSES:
-    TestMarkdownParsing       (3 tests)  - Multi-table markdown parsing
-    TestDateRangeParsing      (5 tests)  - Date range parsing
-    TestDateNormalization     (4 tests)  - Date format normalization
-    TestDeduplication         (3 tests)  - Duplicate removal
-    TestDateRangeExpansion    (2 tests)  - Range expansion
-    TestEdgeCases             (6 tests)  - Edge cases and real-world scenarios
+    TestMarkdownParsing       (4 tests)  - Multi-table markdown parsing
+    TestDateRangeParsing      (2 tests)  - Date range parsing
+    TestDateNormalization     (2 tests)  - Date format normalization
+    TestDeduplication         (1 test)   - Duplicate removal
+    TestDateRangeExpansion    (1 test)   - Range expansion
+    TestExpansionCases        (1 test)   - Table-driven expansion cases
+    TestEdgeCases             (5 tests)  - Edge cases and real-world scenarios
     TestSorting               (1 test)   - Chronological sorting
-    TestIntegration           (1 test)   - End-to-end integration
+    TestIntegration           (3 tests)  - End-to-end integration
+    TestFilePaths             (3 tests)  - Path-based input and output
 
-Total: 25 tests
+Total: 23 tests
 EOF
 }
 
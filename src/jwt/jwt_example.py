@@ -1,65 +1,500 @@
 #!/usr/bin/env python3
 import argparse
 import base64
+import binascii
+import calendar
+import functools
+import hashlib
+import hmac
 import json
 import os
-from typing import Any, Optional, cast
+import time
+import warnings
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
 
 import jwt
+from jwt.algorithms import HMACAlgorithm
+from jwt.warnings import InsecureKeyLengthWarning
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+_urlsafe_b64decode: Callable[[bytes], bytes]
+try:
+    # SIMD-accelerated, drop-in compatible base64 when installed.
+    import pybase64
+
+    _urlsafe_b64decode = pybase64.urlsafe_b64decode
+except ImportError:
+    _urlsafe_b64decode = base64.urlsafe_b64decode
+
+# HS* algorithms are signed and verified directly with hmac/hashlib; anything
+# else (RS*, ES*, ...) goes through PyJWT.
+_HMAC_DIGESTS: dict[str, Callable[..., Any]] = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+# PyJWT's HMAC algorithms, used for key preparation and the minimum key length check.
+_HMAC_ALGORITHMS = {
+    "HS256": HMACAlgorithm(HMACAlgorithm.SHA256),
+    "HS384": HMACAlgorithm(HMACAlgorithm.SHA384),
+    "HS512": HMACAlgorithm(HMACAlgorithm.SHA512),
+}
+
+# Registered claims that PyJWT converts from datetime to a Unix timestamp.
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+# Opt-in cache of verified tokens: key -> (expires_at, header, payload).
+# Keys are digests of the token and secret, never the raw values.
+_VERIFY_CACHE: "OrderedDict[bytes, tuple[float, dict[str, Any], dict[str, Any]]]" = OrderedDict()
+_VERIFY_CACHE_MAX = 10000
+
+# Keyed HMAC objects per (algorithm, key), copied for each token so the key
+# preparation and ipad/opad setup are paid once per key. Each is stored with
+# PyJWT's short-key warning message, or None if the key is long enough.
+_HMAC_PROTOTYPES: "OrderedDict[tuple[str, str], tuple[hmac.HMAC, Optional[str]]]" = OrderedDict()
+_HMAC_PROTOTYPES_MAX = 64
+
+# Signing inputs ("header.payload") of recently signed payloads, keyed on
+# (algorithm, kid, claims). Only flat payloads of these exact types are cached.
+_SIGNING_INPUT_CACHE: "OrderedDict[tuple[Any, ...], bytes]" = OrderedDict()
+_SIGNING_INPUT_CACHE_MAX = 256
+_CACHEABLE_CLAIM_TYPES = frozenset({str, int, bool, type(None), datetime})
+
+# PyJWT's message for a payload that is not a dict.
+_PAYLOAD_TYPE_ERROR = "Expecting a dict object, as JWT only supports JSON objects as payloads."
+
+# Tokens longer than this are rejected before any decoding or cache lookup.
+_MAX_TOKEN_LENGTH = 8192
+
+# The only bytes a base64url segment may contain, besides trailing "=".
+_BASE64URL_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+@functools.lru_cache(maxsize=128)
+def _read_key_cached(path: str, mtime_ns: int, ctime_ns: int, size: int, inode: int) -> str:
+    # The file's stat fields are part of the cache key, so editing or replacing the
+    # file invalidates the entry. ctime changes on any write even when mtime is kept,
+    # e.g. a rewrite within one timestamp tick or a restore with touch -r / rsync.
+    with open(path, "r") as f:
+        return f.read()
 
 
 def load_key(key_param: str) -> str:
     # If key_param is a path to an existing file, load its contents.
     if os.path.exists(key_param):
         try:
-            with open(key_param, "r") as f:
-                return f.read()
+            st = os.stat(key_param)
+            return _read_key_cached(key_param, st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
         except Exception as e:
             print(f"Failed to load key from {key_param}: {e}")
             exit(1)
     return key_param
 
 
+def _is_plain_json(obj: Any) -> bool:
+    """
+    True if obj holds only str, bool, None, 64-bit int, str-keyed dict, list and
+    tuple values: the types orjson and json encode and decode identically. Floats
+    (NaN, exponent formatting), datetimes and bigger ints differ between the two.
+    """
+    kind = type(obj)
+    if kind is str or kind is bool or obj is None:
+        return True
+    if kind is int:
+        return -(2**63) <= int(obj) < 2**64
+    if kind is dict:
+        return all(type(k) is str and _is_plain_json(v) for k, v in obj.items())
+    if kind is list or kind is tuple:
+        return all(_is_plain_json(v) for v in obj)
+    return False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serializes obj compactly to UTF-8 bytes, matching json.dumps(obj, separators=(",", ":")).
+    Uses orjson when available for plain JSON values, falling back to json for
+    anything it would encode differently (non-ASCII text, floats, datetimes, big ints).
+    """
+    if _HAS_ORJSON and _is_plain_json(obj):
+        data = orjson.dumps(obj)
+        if data.isascii():
+            return data
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: "bytes | str") -> Any:
+    """
+    Parses data like json.loads. orjson is tried first; input it rejects (NaN, lone
+    surrogates) or that decodes to floats, which include ints too big for 64 bits,
+    is parsed again with json so the result and any error match PyJWT.
+    """
+    if _HAS_ORJSON:
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if _is_plain_json(obj):
+                return obj
+    return json.loads(data)
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(segment: bytes, name: str) -> bytes:
+    """
+    Decodes a base64url segment as strictly as PyJWT: url-safe alphabet only,
+    at most two "=" of padding, and canonical encoding (no stray low bits in
+    the last character), so a tampered segment cannot decode to the same bytes.
+    """
+    stripped = segment.rstrip(b"=")
+    padding = len(segment) - len(stripped)
+    if (
+        padding > 2
+        or (padding and len(segment) % 4)
+        or len(stripped) % 4 == 1
+        or stripped.translate(None, _BASE64URL_ALPHABET)
+    ):
+        raise jwt.exceptions.DecodeError(f"Invalid {name} padding")
+    try:
+        decoded = _urlsafe_b64decode(stripped + b"==="[: -len(stripped) % 4])
+    except (TypeError, binascii.Error) as e:
+        raise jwt.exceptions.DecodeError(f"Invalid {name} padding") from e
+    if _b64url_encode(decoded) != stripped:
+        raise jwt.exceptions.DecodeError(f"Invalid {name} padding")
+    return decoded
+
+
+@functools.lru_cache(maxsize=128)
+def _encoded_header(algorithm: str, kid: Optional[str]) -> bytes:
+    """
+    Returns the base64url-encoded header segment, serialized the way PyJWT does
+    (sorted keys, compact separators) so tokens are byte-identical.
+    """
+    header: dict[str, Any] = {"alg": algorithm, "typ": "JWT"}
+    if kid is not None:
+        header["kid"] = kid
+    return _b64url_encode(json.dumps(header, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+
+
+def _hmac_key(key: str, algorithm: str) -> bytes:
+    # PyJWT's key preparation rejects PEM/SSH keys used as HMAC secrets.
+    return _HMAC_ALGORITHMS[algorithm].prepare_key(key)
+
+
+def _new_hmac(key: str, algorithm: str) -> "hmac.HMAC":
+    """
+    Returns a fresh HMAC for key, copied from a cached keyed prototype.
+    Warns with InsecureKeyLengthWarning, as PyJWT does, when the key is shorter
+    than the algorithm's digest.
+    """
+    cache_key = (algorithm, key)
+    entry = _HMAC_PROTOTYPES.get(cache_key)
+    if entry is None:
+        prepared_key = _hmac_key(key, algorithm)
+        entry = (
+            hmac.new(prepared_key, digestmod=_HMAC_DIGESTS[algorithm]),
+            _HMAC_ALGORITHMS[algorithm].check_key_length(prepared_key),
+        )
+        _HMAC_PROTOTYPES[cache_key] = entry
+        if len(_HMAC_PROTOTYPES) > _HMAC_PROTOTYPES_MAX:
+            _HMAC_PROTOTYPES.popitem(last=False)
+    else:
+        _HMAC_PROTOTYPES.move_to_end(cache_key)
+    prototype, key_length_msg = entry
+    if key_length_msg:
+        warnings.warn(key_length_msg, InsecureKeyLengthWarning, stacklevel=3)
+    return prototype.copy()
+
+
+def _split_token(token: bytes) -> tuple[bytes, bytes, bytes, bytes]:
+    """
+    Splits a token into (signing_input, header, payload, signature) segments.
+    """
+    signing_input, sep, signature_segment = token.rpartition(b".")
+    header_segment, sep2, payload_segment = signing_input.partition(b".")
+    if not sep or not sep2:
+        raise jwt.exceptions.DecodeError("Not enough segments")
+    return signing_input, header_segment, payload_segment, signature_segment
+
+
+def _load_json_object(data: bytes, name: str) -> dict[str, Any]:
+    try:
+        obj = _json_loads(data)
+    except ValueError as e:
+        raise jwt.exceptions.DecodeError(f"Invalid {name} string: {e}") from e
+    if not isinstance(obj, dict):
+        raise jwt.exceptions.DecodeError(f"Invalid {name} string: must be a json object")
+    return obj
+
+
+def _verify_hmac_token(token: str, key: str, algorithm: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Verifies an HS* token's signature and returns its (header, payload).
+    Raises the same PyJWT exceptions jwt.decode would for these failures.
+    """
+    signing_input, header_segment, payload_segment, signature_segment = _split_token(token.encode("utf-8"))
+    header = _load_json_object(_b64url_decode(header_segment, "header"), "header")
+    if "kid" in header and not isinstance(header["kid"], str):
+        raise jwt.exceptions.InvalidTokenError("Key ID header parameter must be a string")
+    if "crit" in header or "b64" in header:
+        # Critical extensions (RFC 7515 4.1.11) and unencoded payloads (RFC 7797)
+        # are left to PyJWT, which rejects any extension it does not support.
+        decoded = jwt.decode_complete(token, key, algorithms=[algorithm])
+        return decoded["header"], decoded["payload"]
+    if header.get("alg") != algorithm:
+        raise jwt.exceptions.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    signature = _b64url_decode(signature_segment, "crypto")
+    mac = _new_hmac(key, algorithm)
+    mac.update(signing_input)
+    if not hmac.compare_digest(signature, mac.digest()):
+        raise jwt.exceptions.InvalidSignatureError("Signature verification failed")
+
+    payload = _load_json_object(_b64url_decode(payload_segment, "payload"), "payload")
+    return header, payload
+
+
+def _validate_claims(payload: dict[str, Any]) -> None:
+    """
+    Applies the registered-claim checks jwt.decode runs by default
+    (no leeway, no expected audience).
+    """
+    now = time.time()
+    if "iat" in payload:
+        try:
+            iat = int(payload["iat"])
+        except (TypeError, ValueError, OverflowError):
+            raise jwt.exceptions.InvalidIssuedAtError("Issued At claim (iat) must be an integer.") from None
+        if iat > now:
+            raise jwt.exceptions.ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in payload:
+        try:
+            nbf = int(payload["nbf"])
+        except (TypeError, ValueError, OverflowError):
+            raise jwt.exceptions.DecodeError("Not Before claim (nbf) must be an integer.") from None
+        if nbf > now:
+            raise jwt.exceptions.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "exp" in payload:
+        try:
+            exp = int(payload["exp"])
+        except (TypeError, ValueError, OverflowError):
+            raise jwt.exceptions.DecodeError("Expiration Time claim (exp) must be an integer.") from None
+        if exp <= now:
+            raise jwt.exceptions.ExpiredSignatureError("Signature has expired")
+    if payload.get("aud"):
+        # No audience is expected, so a token that names one is rejected.
+        raise jwt.exceptions.InvalidAudienceError("Invalid audience")
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise jwt.exceptions.InvalidSubjectError("Subject must be a string")
+    if "jti" in payload and not isinstance(payload["jti"], str):
+        raise jwt.exceptions.InvalidJTIError("JWT ID must be a string")
+
+
 def create_simple_jwt(
     payload: dict[str, Any],
     key: str,
     kid: Optional[str] = None,
     algorithm: str = "HS256",
 ) -> str:
-    headers = {"kid": kid} if kid is not None else None
-    token = jwt.encode(payload, key, algorithm=algorithm, headers=headers)
-    # jwt.encode returns str in PyJWT 2.x, but type stubs say bytes
-    if isinstance(token, bytes):
-        return token.decode("utf-8")
-    return token
+    if not isinstance(payload, dict):
+        raise TypeError(_PAYLOAD_TYPE_ERROR)
+    if algorithm not in _HMAC_DIGESTS:
+        headers = {"kid": kid} if kid is not None else None
+        token = jwt.encode(payload, key, algorithm=algorithm, headers=headers)
+        # jwt.encode returns str in PyJWT 2.x, but type stubs say bytes
+        if isinstance(token, bytes):
+            return token.decode("utf-8")
+        return token
 
+    return _sign_hmac(_signing_input(payload, algorithm, kid), _new_hmac(key, algorithm))
 
-def decode_simple_jwt(token: str, key: str, algorithm: str = "HS256") -> dict[str, Any]:
-    decoded = jwt.decode(token, key, algorithms=[algorithm])
-    return decoded
+
+def _encoded_payload(payload: dict[str, Any]) -> bytes:
+    """
+    Returns the base64url-encoded payload segment, with datetime time claims
+    converted to Unix timestamps as PyJWT does.
+    """
+    claims = payload
+    if any(isinstance(payload.get(claim), datetime) for claim in _TIME_CLAIMS):
+        claims = dict(payload)
+        for claim in _TIME_CLAIMS:
+            value = claims.get(claim)
+            if isinstance(value, datetime):
+                claims[claim] = calendar.timegm(value.utctimetuple())
+    return _b64url_encode(_json_dumps(claims))
+
+
+def _signing_input(payload: dict[str, Any], algorithm: str, kid: Optional[str]) -> bytes:
+    """
+    Returns the "header.payload" signing input, served from _SIGNING_INPUT_CACHE
+    when the payload holds only flat scalar claims.
+    """
+    items = []
+    for name, value in payload.items():
+        # The value's type is part of the key: 1, 1.0 and True hash alike but serialize differently.
+        kind = type(value)
+        if kind not in _CACHEABLE_CLAIM_TYPES:
+            return _encoded_header(algorithm, kid) + b"." + _encoded_payload(payload)
+        if kind is datetime:
+            # Aware datetimes in different offsets compare equal; key on the exact
+            # wall time and offset instead.
+            value = value.isoformat()
+        items.append((name, kind, value))
+    # Claim order is kept, since it determines the serialized payload.
+    cache_key = (algorithm, kid, tuple(items))
+
+    signing_input = _SIGNING_INPUT_CACHE.get(cache_key)
+    if signing_input is None:
+        signing_input = _encoded_header(algorithm, kid) + b"." + _encoded_payload(payload)
+        _SIGNING_INPUT_CACHE[cache_key] = signing_input
+        if len(_SIGNING_INPUT_CACHE) > _SIGNING_INPUT_CACHE_MAX:
+            _SIGNING_INPUT_CACHE.popitem(last=False)
+    else:
+        _SIGNING_INPUT_CACHE.move_to_end(cache_key)
+    return signing_input
+
+
+def _sign_hmac(signing_input: bytes, mac: "hmac.HMAC") -> str:
+    # mac is a fresh keyed HMAC.
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url_encode(mac.digest())).decode("ascii")
+
+
+def batch_sign(
+    payloads: Iterable[dict[str, Any]],
+    key: str,
+    kid: Optional[str] = None,
+    algorithm: str = "HS256",
+) -> list[str]:
+    """
+    Signs many payloads with the same key, returning the tokens in order.
+    Equivalent to calling create_simple_jwt for each payload, but for HS*
+    algorithms the keyed HMAC is prepared once for the batch.
+    """
+    if algorithm not in _HMAC_DIGESTS:
+        return [create_simple_jwt(payload, key, kid=kid, algorithm=algorithm) for payload in payloads]
+    prototype = _new_hmac(key, algorithm)
+    tokens = []
+    for payload in payloads:
+        if not isinstance(payload, dict):
+            raise TypeError(_PAYLOAD_TYPE_ERROR)
+        tokens.append(_sign_hmac(_signing_input(payload, algorithm, kid), prototype.copy()))
+    return tokens
+
+
+def _check_token_shape(token: str) -> None:
+    """
+    Rejects tokens that cannot be a compact JWS (header.payload.signature)
+    before any base64, JSON, HMAC or cache work is done on them.
+    """
+    if len(token) > _MAX_TOKEN_LENGTH:
+        raise jwt.exceptions.DecodeError(f"Token exceeds {_MAX_TOKEN_LENGTH} characters")
+    if token.count(".") != 2:
+        raise jwt.exceptions.DecodeError("Malformed token: expected 3 segments")
+
+
+def _verify_and_decode(token: str, key: str, algorithm: str) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Verifies the token and validates its claims, returning (header, payload).
+    """
+    if algorithm not in _HMAC_DIGESTS:
+        # decode_complete verifies once and returns the header alongside the payload.
+        decoded = jwt.decode_complete(token, key, algorithms=[algorithm])
+        return decoded["header"], decoded["payload"]
+    header, payload = _verify_hmac_token(token, key, algorithm)
+    _validate_claims(payload)
+    return header, payload
+
+
+def _cached_verify(token: str, key: str, algorithm: str, ttl: float) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Like _verify_and_decode, but serves repeat tokens from _VERIFY_CACHE for up to
+    ttl seconds, never past the token's own exp.
+    """
+    cache_key = (
+        hashlib.sha256(token.encode("utf-8")).digest()
+        + hashlib.sha256(key.encode("utf-8")).digest()[:8]
+        + algorithm.encode("ascii")
+    )
+    now = time.time()
+    entry = _VERIFY_CACHE.get(cache_key)
+    if entry is not None:
+        expires_at, header, payload = entry
+        if expires_at > now:
+            _VERIFY_CACHE.move_to_end(cache_key)
+            return header, payload
+        del _VERIFY_CACHE[cache_key]
+
+    header, payload = _verify_and_decode(token, key, algorithm)
+    expires_at = now + ttl
+    if "exp" in payload:
+        expires_at = min(expires_at, float(payload["exp"]))
+    _VERIFY_CACHE[cache_key] = (expires_at, header, payload)
+    if len(_VERIFY_CACHE) > _VERIFY_CACHE_MAX:
+        _VERIFY_CACHE.popitem(last=False)
+    return header, payload
 
 
-def get_verified_header(token: str, key: str, algorithm: str = "HS256") -> dict[str, Any]:
+def decode_simple_jwt(
+    token: str,
+    key: str,
+    algorithm: str = "HS256",
+    cache_ttl: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Verifies the token and returns its payload. If cache_ttl is set, verified
+    results are cached for that many seconds (bounded by exp).
+    """
+    _check_token_shape(token)
+    if cache_ttl is not None:
+        _header, payload = _cached_verify(token, key, algorithm, cache_ttl)
+        return dict(payload)
+    _header, payload = _verify_and_decode(token, key, algorithm)
+    return payload
+
+
+def get_verified_header(
+    token: str,
+    key: str,
+    algorithm: str = "HS256",
+    cache_ttl: Optional[float] = None,
+) -> dict[str, Any]:
     """
     Verifies the JWT token's signature using the provided key and specified algorithm,
-    then extracts and returns the header.
-    """
-    # Verify token signature (will raise an exception if invalid)
-    jwt.decode(token, key, algorithms=[algorithm])
-    # Extract and decode the header segment (it's the first part of the token)
-    header_segment = token.split(".")[0]
-    header_segment += "=" * (-len(header_segment) % 4)  # Add padding if necessary.
-    header_bytes = base64.urlsafe_b64decode(header_segment)
-    header = cast(dict[str, Any], json.loads(header_bytes))
+    then extracts and returns the header. If cache_ttl is set, shares the
+    verification cache used by decode_simple_jwt.
+    """
+    _check_token_shape(token)
+    if cache_ttl is not None:
+        header, _payload = _cached_verify(token, key, algorithm, cache_ttl)
+        return dict(header)
+    # Verification (raises if invalid) already yields the decoded header.
+    header, _payload = _verify_and_decode(token, key, algorithm)
     return header
 
 
-def main(args: Optional[list[str]] = None) -> None:
+# Default --payload, stored parsed so main() skips decoding it.
+_DEFAULT_PAYLOAD: dict[str, Any] = {"hello": "world"}
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Create or decode a simple JWT token.")
     parser.add_argument(
         "--payload",
         type=str,
-        default='{"hello": "world"}',
+        default=_DEFAULT_PAYLOAD,
         help='JSON formatted payload (e.g., \'{"hello": "world"}\').',
     )
     parser.add_argument(
@@ -97,7 +532,18 @@ def main(args: Optional[list[str]] = None) -> None:
         action="store_true",
         help="If set (with --decode), skip signature verification when decoding.",
     )
-    parsed_args = parser.parse_args(args)
+    return parser
+
+
+# Built on first use by main() and reused across calls.
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def main(args: Optional[list[str]] = None) -> None:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    parsed_args = _PARSER.parse_args(args)
 
     # Load the key from file if applicable.
     secret = load_key(parsed_args.secret)
@@ -149,11 +595,15 @@ def main(args: Optional[list[str]] = None) -> None:
             print("Verified header:")
             print(header)
     else:
-        try:
-            payload = json.loads(parsed_args.payload)
-        except json.JSONDecodeError as e:
-            print("Invalid JSON for payload:", e)
-            exit(1)
+        if isinstance(parsed_args.payload, dict):
+            # The default is kept parsed; only a user-supplied --payload needs JSON decoding.
+            payload = dict(parsed_args.payload)
+        else:
+            try:
+                payload = _json_loads(parsed_args.payload)
+            except json.JSONDecodeError as e:
+                print("Invalid JSON for payload:", e)
+                exit(1)
         token = create_simple_jwt(payload, secret, kid=kid, algorithm=algorithm)
         print("Generated JWT token:")
         print(token)
@@ -1,11 +1,21 @@
+import base64
 import datetime
+import hashlib
+import hmac
 import io
+import json
+import os
+import tempfile
 import unittest
+import warnings
+from typing import Any
 from unittest.mock import patch
 
+import jwt_example
 from jwt_example import create_simple_jwt, decode_simple_jwt, get_verified_header, main
 
 import jwt  # Ensure jwt is imported
+from jwt.warnings import InsecureKeyLengthWarning
 
 
 class TestJWTExample(unittest.TestCase):
@@ -40,14 +50,102 @@ class TestJWTExample(unittest.TestCase):
         with self.assertRaises(jwt.exceptions.DecodeError):  # type: ignore[attr-defined]
             decode_simple_jwt(malformed_token, secret)
 
+    def test_malformed_token_rejected_before_cache(self) -> None:
+        jwt_example._VERIFY_CACHE.clear()
+        for token in ("this.is.not.a.valid.token", "a.b", "a" * 8192 + ".b.c"):
+            with self.assertRaises(jwt.exceptions.DecodeError):  # type: ignore[attr-defined]
+                decode_simple_jwt(token, "mysecret", cache_ttl=60)
+            with self.assertRaises(jwt.exceptions.DecodeError):  # type: ignore[attr-defined]
+                get_verified_header(token, "mysecret", cache_ttl=60)
+        self.assertEqual(len(jwt_example._VERIFY_CACHE), 0)
+
+    def test_hmac_fast_path_matches_pyjwt(self) -> None:
+        payload = {"hello": "world", "exp": datetime.datetime.utcnow() + datetime.timedelta(minutes=5)}
+        secret = "mysecret"
+        for algorithm in ("HS256", "HS384", "HS512"):
+            for kid in (None, "key-id-1"):
+                headers = {"kid": kid} if kid is not None else None
+                expected = jwt.encode(payload, secret, algorithm=algorithm, headers=headers)
+                token = create_simple_jwt(payload, secret, kid=kid, algorithm=algorithm)
+                self.assertEqual(token, expected)
+                self.assertEqual(
+                    decode_simple_jwt(token, secret, algorithm=algorithm),
+                    jwt.decode(expected, secret, algorithms=[algorithm]),
+                )
+
     def test_token_tampering(self) -> None:
         payload = {"hello": "world"}
         secret = "mysecret"
         token = create_simple_jwt(payload, secret)
         tampered_token = token + "tampered"
-        with self.assertRaises(jwt.exceptions.InvalidSignatureError):  # type: ignore[attr-defined]
+        # Like PyJWT 2.15, the lengthened signature is rejected as non-canonical base64url.
+        with self.assertRaisesRegex(jwt.exceptions.DecodeError, "Invalid crypto padding"):  # type: ignore[attr-defined]
             decode_simple_jwt(tampered_token, secret)
 
+    def test_tampered_signature_encodings_rejected(self) -> None:
+        token = create_simple_jwt({"hello": "world"}, "mysecret")
+        signature = token.rsplit(".", 1)[1]
+        # HS256 signatures are 43 characters, so the last one carries 2 unused bits.
+        last = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_".index(signature[-1])
+        non_canonical = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"[last ^ 1]
+        tampered = [
+            token[:-3] + "!" + token[-3:],
+            token[:-1] + non_canonical,
+            token + "===",
+            token[:-2] + "+/",
+        ]
+        for tampered_token in tampered:
+            with self.subTest(token=tampered_token):
+                with self.assertRaises(jwt.exceptions.DecodeError):  # type: ignore[attr-defined]
+                    jwt.decode(tampered_token, "mysecret", algorithms=["HS256"])
+                error = jwt.exceptions.DecodeError  # type: ignore[attr-defined]
+                with self.assertRaisesRegex(error, "Invalid crypto padding"):
+                    decode_simple_jwt(tampered_token, "mysecret")
+
+    def test_unknown_crit_header_rejected(self) -> None:
+        headers = {"crit": ["exp-ext"], "exp-ext": 1}
+        token = jwt.encode({"hello": "world"}, "mysecret", algorithm="HS256", headers=headers)
+        with self.assertRaises(jwt.exceptions.InvalidTokenError):  # type: ignore[attr-defined]
+            decode_simple_jwt(token, "mysecret")
+
+    def test_non_string_kid_rejected(self) -> None:
+        # jwt.encode refuses a non-string kid, so sign the token by hand.
+        signing_input = b".".join(
+            base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=")
+            for part in ({"alg": "HS256", "kid": 7}, {"hello": "world"})
+        )
+        signature = hmac.new(b"mysecret", signing_input, hashlib.sha256).digest()
+        token = (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode()
+        with self.assertRaises(jwt.exceptions.InvalidTokenError):  # type: ignore[attr-defined]
+            decode_simple_jwt(token, "mysecret")
+
+    def test_non_numeric_time_claims_rejected(self) -> None:
+        errors = {
+            "iat": jwt.exceptions.InvalidIssuedAtError,  # type: ignore[attr-defined]
+            "nbf": jwt.exceptions.DecodeError,  # type: ignore[attr-defined]
+            "exp": jwt.exceptions.DecodeError,  # type: ignore[attr-defined]
+        }
+        for claim, error in errors.items():
+            for value in (None, [1], {"a": 1}, "soon"):
+                token = jwt.encode({claim: value}, "mysecret", algorithm="HS256")
+                with self.subTest(claim=claim, value=value):
+                    with self.assertRaises(error):
+                        jwt.decode(token, "mysecret", algorithms=["HS256"])
+                    with self.assertRaises(error):
+                        decode_simple_jwt(token, "mysecret")
+
+    def test_non_string_sub_and_jti_rejected(self) -> None:
+        for claims, error in (
+            ({"sub": 42}, jwt.exceptions.InvalidSubjectError),  # type: ignore[attr-defined]
+            ({"jti": ["a"]}, jwt.exceptions.InvalidJTIError),  # type: ignore[attr-defined]
+        ):
+            token = jwt.encode(claims, "mysecret", algorithm="HS256")
+            with self.subTest(claims=claims):
+                with self.assertRaises(error):
+                    jwt.decode(token, "mysecret", algorithms=["HS256"])
+                with self.assertRaises(error):
+                    decode_simple_jwt(token, "mysecret")
+
 
 class TestJWTMain(unittest.TestCase):
     def test_main_default(self) -> None:
@@ -58,6 +156,12 @@ class TestJWTMain(unittest.TestCase):
             self.assertIn("Decoded payload:", output)
             self.assertIn("'hello': 'world'", output)
 
+    def test_main_default_payload(self) -> None:
+        with patch("sys.stdout", new=io.StringIO()) as fake_output:
+            main(["--secret", "mysecret"])
+            self.assertIn("'hello': 'world'", fake_output.getvalue())
+        self.assertEqual(jwt_example._DEFAULT_PAYLOAD, {"hello": "world"})
+
     def test_invalid_json(self) -> None:
         with patch("sys.stdout", new=io.StringIO()) as fake_output:
             with self.assertRaises(SystemExit) as cm:
@@ -252,5 +356,182 @@ class TestJWTAlgorithmParameter(unittest.TestCase):
         self.assertEqual(decoded, payload)
 
 
+class TestJWTVerificationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        jwt_example._VERIFY_CACHE.clear()
+
+    def test_cached_decode_matches_uncached(self) -> None:
+        payload = {"hello": "world"}
+        secret = "mysecret"
+        token = create_simple_jwt(payload, secret, kid="key-id-1")
+        self.assertEqual(decode_simple_jwt(token, secret, cache_ttl=60), payload)
+        self.assertEqual(get_verified_header(token, secret, cache_ttl=60).get("kid"), "key-id-1")
+
+    def test_cache_hit_skips_verification(self) -> None:
+        token = create_simple_jwt({"hello": "world"}, "mysecret")
+        with patch("jwt_example._verify_and_decode", wraps=jwt_example._verify_and_decode) as verify:
+            decode_simple_jwt(token, "mysecret", cache_ttl=60)
+            decode_simple_jwt(token, "mysecret", cache_ttl=60)
+            get_verified_header(token, "mysecret", cache_ttl=60)
+        self.assertEqual(verify.call_count, 1)
+
+    def test_cache_is_keyed_on_secret(self) -> None:
+        token = create_simple_jwt({"hello": "world"}, "mysecret")
+        decode_simple_jwt(token, "mysecret", cache_ttl=60)
+        with self.assertRaises(jwt.exceptions.InvalidSignatureError):  # type: ignore[attr-defined]
+            decode_simple_jwt(token, "wrongsecret", cache_ttl=60)
+
+    def test_expired_entry_is_reverified(self) -> None:
+        token = create_simple_jwt({"hello": "world"}, "mysecret")
+        with patch("jwt_example._verify_and_decode", wraps=jwt_example._verify_and_decode) as verify:
+            decode_simple_jwt(token, "mysecret", cache_ttl=0)
+            decode_simple_jwt(token, "mysecret", cache_ttl=0)
+        self.assertEqual(verify.call_count, 2)
+
+
+class TestHMACPrototypeCache(unittest.TestCase):
+    def test_prototype_cache_is_bounded_and_reusable(self) -> None:
+        jwt_example._HMAC_PROTOTYPES.clear()
+        for i in range(jwt_example._HMAC_PROTOTYPES_MAX + 10):
+            create_simple_jwt({"hello": "world"}, f"secret-{i}")
+        self.assertEqual(len(jwt_example._HMAC_PROTOTYPES), jwt_example._HMAC_PROTOTYPES_MAX)
+        token = create_simple_jwt({"hello": "world"}, "mysecret")
+        self.assertEqual(token, create_simple_jwt({"hello": "world"}, "mysecret"))
+        self.assertEqual(decode_simple_jwt(token, "mysecret"), {"hello": "world"})
+
+
+class TestJWTBatchSign(unittest.TestCase):
+    def test_batch_sign_matches_create_simple_jwt(self) -> None:
+        exp = datetime.datetime.utcnow() + datetime.timedelta(minutes=5)
+        payloads: list[dict[str, Any]] = [{"hello": "world"}, {"sub": "user-1", "exp": exp}, {"n": 1}]
+        for algorithm in ("HS256", "HS512"):
+            tokens = jwt_example.batch_sign(payloads, "mysecret", kid="key-id-1", algorithm=algorithm)
+            expected = [create_simple_jwt(p, "mysecret", kid="key-id-1", algorithm=algorithm) for p in payloads]
+            self.assertEqual(tokens, expected)
+
+
+class TestSigningInputCache(unittest.TestCase):
+    def setUp(self) -> None:
+        jwt_example._SIGNING_INPUT_CACHE.clear()
+
+    def test_cached_tokens_match_pyjwt(self) -> None:
+        payloads: list[dict[str, Any]] = [
+            {"a": 1},
+            {"a": True},
+            {"a": 1},
+            {"b": "x", "a": 1},
+            {"a": 1, "b": "x"},
+            {"a": [1]},
+            {"a": 1.0},
+        ]
+        for payload in payloads:
+            token = create_simple_jwt(payload, "mysecret")
+            self.assertEqual(token, jwt.encode(payload, "mysecret", algorithm="HS256"))
+        # Nested and float payloads are not cacheable; every distinct flat payload gets its own entry.
+        self.assertEqual(len(jwt_example._SIGNING_INPUT_CACHE), 4)
+
+    def test_equal_datetimes_in_different_offsets_not_shared(self) -> None:
+        plus_one = datetime.timezone(datetime.timedelta(hours=1))
+        first = datetime.datetime(2030, 1, 1, 1, 0, tzinfo=plus_one)
+        second = datetime.datetime(2030, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
+        self.assertEqual(first, second)
+        payloads: list[dict[str, Any]] = [{"exp": first, "n": 1}, {"exp": second, "n": 1}, {"exp": second, "n": 1.0}]
+        for payload in payloads:
+            token = create_simple_jwt(payload, "mysecret")
+            self.assertEqual(token, jwt.encode(payload, "mysecret", algorithm="HS256"))
+        self.assertEqual(len(jwt_example._SIGNING_INPUT_CACHE), 2)
+
+    def test_cache_is_keyed_on_kid(self) -> None:
+        token = create_simple_jwt({"hello": "world"}, "mysecret", kid="kid-1")
+        other = create_simple_jwt({"hello": "world"}, "mysecret", kid="kid-2")
+        self.assertEqual(jwt.get_unverified_header(token)["kid"], "kid-1")
+        self.assertEqual(jwt.get_unverified_header(other)["kid"], "kid-2")
+
+
+class TestSigningChecks(unittest.TestCase):
+    def test_short_key_warns_like_pyjwt(self) -> None:
+        for algorithm in ("HS256", "HS512"):
+            with self.assertWarns(InsecureKeyLengthWarning) as expected:
+                jwt.encode({"hello": "world"}, "short!", algorithm=algorithm)
+            with self.assertWarns(InsecureKeyLengthWarning) as signed:
+                token = create_simple_jwt({"hello": "world"}, "short!", algorithm=algorithm)
+            self.assertEqual(str(signed.warning), str(expected.warning))
+            with self.assertWarns(InsecureKeyLengthWarning):
+                decode_simple_jwt(token, "short!", algorithm=algorithm)
+            with self.assertWarns(InsecureKeyLengthWarning):
+                jwt_example.batch_sign([{"hello": "world"}], "short!", algorithm=algorithm)
+
+    def test_key_of_digest_length_does_not_warn(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", InsecureKeyLengthWarning)
+            token = create_simple_jwt({"hello": "world"}, "k" * 32)
+            self.assertEqual(decode_simple_jwt(token, "k" * 32), {"hello": "world"})
+
+    def test_non_dict_payload_raises_type_error(self) -> None:
+        for payload in ("hello", ["hello"], None):
+            with self.assertRaises(TypeError):
+                jwt.encode(payload, "mysecret", algorithm="HS256")  # type: ignore[arg-type]
+            with self.assertRaises(TypeError):
+                create_simple_jwt(payload, "mysecret")  # type: ignore[arg-type]
+            with self.assertRaises(TypeError):
+                jwt_example.batch_sign([payload], "mysecret")  # type: ignore[list-item]
+
+
+class TestJSONParity(unittest.TestCase):
+    def test_tokens_match_pyjwt_for_non_plain_values(self) -> None:
+        for value in (1e-7, 0.1, float("nan"), 2**70, -(2**64), "caf\u00e9"):
+            payload = {"sub": "user-1", "value": value}
+            self.assertEqual(create_simple_jwt(payload, "mysecret"), jwt.encode(payload, "mysecret", algorithm="HS256"))
+
+    def test_naive_datetime_in_other_claim_rejected(self) -> None:
+        payload = {"when": datetime.datetime(2024, 1, 1)}
+        with self.assertRaises(TypeError):
+            jwt.encode(payload, "mysecret", algorithm="HS256")
+        with self.assertRaises(TypeError):
+            create_simple_jwt(payload, "mysecret")
+
+    def test_decoded_values_match_pyjwt(self) -> None:
+        for value in (2**70, 1e-7, float("inf")):
+            token = jwt.encode({"value": value}, "mysecret", algorithm="HS256")
+            decoded = decode_simple_jwt(token, "mysecret")
+            self.assertEqual(decoded, jwt.decode(token, "mysecret", algorithms=["HS256"]))
+            self.assertIs(type(decoded["value"]), type(value))
+
+
+class TestLoadKey(unittest.TestCase):
+    def test_key_file_reloaded_after_modification(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            key_path = os.path.join(tmpdir, "secret.key")
+            with open(key_path, "w") as f:
+                f.write("first-secret")
+            self.assertEqual(jwt_example.load_key(key_path), "first-secret")
+
+            with open(key_path, "w") as f:
+                f.write("second-secret")
+            # Bump mtime explicitly; the rewrite may land within the filesystem's timestamp granularity.
+            stat = os.stat(key_path)
+            os.utime(key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(jwt_example.load_key(key_path), "second-secret")
+
+    def test_key_file_reloaded_when_mtime_is_restored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            key_path = os.path.join(tmpdir, "secret.key")
+            with open(key_path, "w") as f:
+                f.write("first-secret")
+            stat = os.stat(key_path)
+            self.assertEqual(jwt_example.load_key(key_path), "first-secret")
+
+            # Replace the file with one of the same size and restore its mtime, as touch -r or rsync would.
+            replacement = os.path.join(tmpdir, "secret.key.new")
+            with open(replacement, "w") as f:
+                f.write("second-secret")
+            os.replace(replacement, key_path)
+            os.utime(key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(jwt_example.load_key(key_path), "second-secret")
+
+    def test_non_path_returned_verbatim(self) -> None:
+        self.assertEqual(jwt_example.load_key("mysecret"), "mysecret")
+
+
 if __name__ == "__main__":
     unittest.main()
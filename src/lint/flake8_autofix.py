@@ -9,13 +9,59 @@ Follows project's Domain Driven Design principles with simple, focused design.
 """
 
 import argparse
+import contextlib
+import difflib
+import functools
+import importlib
+import importlib.util
+import io
+import mmap
+import os
 import shutil
+import signal
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+try:
+    import autoflake  # type: ignore[import-untyped]
 
+    _HAS_AUTOFLAKE = True
+except ImportError:
+    _HAS_AUTOFLAKE = False
+
+try:
+    import fcntl
+
+    _HAS_FCNTL = True
+except ImportError:  # Windows
+    _HAS_FCNTL = False
+
+# Linux ioctl that clones a file's extents (reflink) on Btrfs/XFS and similar
+FICLONE = 0x40049409
+
+EXCLUDE_DIRS = frozenset(
+    {
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".git",
+        "target",
+        "build",
+        "dist",
+    }
+)
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_SYNTAX_THRESHOLD = 64
+# Formatting a file costs far more than compiling it, so the pool pays off sooner
+PARALLEL_FIX_THRESHOLD = 8
+
+
+@functools.lru_cache(maxsize=None)
 def check_tool_available(tool_name: str) -> bool:
     """Check if a formatting tool is available."""
     return shutil.which(tool_name) is not None or tool_importable(tool_name)
@@ -23,15 +69,110 @@ def check_tool_available(tool_name: str) -> bool:
 
 def tool_importable(tool_name: str) -> bool:
     """Check if a tool can be imported as a Python module."""
+    # find_spec locates the module in-process without importing it
+    return importlib.util.find_spec(tool_name) is not None
+
+
+def _load_tool_entry_point(tool: str) -> Optional[Callable[[List[str]], Optional[int]]]:
+    """Import a tool's CLI entry point for in-process use, or None if unavailable."""
     try:
-        subprocess.run(
-            [sys.executable, "-c", f"import {tool_name}"],
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+        if tool == "black":
+            black = importlib.import_module("black")
+            # Extra workers are forked processes whose diff output would bypass
+            # the captured stdout, so keep black on its single-thread executor
+            return lambda argv: black.main(
+                ["--workers=1"] + argv, standalone_mode=False
+            )
+        if tool == "isort":
+            isort_main = importlib.import_module("isort.main")
+            return lambda argv: isort_main.main(argv)
+        if tool == "autopep8":
+            autopep8 = importlib.import_module("autopep8")
+            return lambda argv: _run_autopep8(autopep8, argv)
+    except ImportError:
+        pass
+    return None
+
+
+def _run_autopep8(autopep8: Any, argv: List[str]) -> Optional[int]:
+    """Run autopep8's CLI, restoring the SIGPIPE handler it resets to SIG_DFL."""
+    sigpipe = getattr(signal, "SIGPIPE", None)
+    if sigpipe is None:  # Windows
+        result: Optional[int] = autopep8.main(["autopep8"] + argv)
+        return result
+    previous = signal.getsignal(sigpipe)
+    try:
+        result = autopep8.main(["autopep8"] + argv)
+    finally:
+        if previous is not None and signal.getsignal(sigpipe) is not previous:
+            signal.signal(sigpipe, previous)
+    return result
+
+
+# Tool name -> in-process entry point (None when it must run as a subprocess)
+_TOOL_ENTRY_POINTS: Dict[str, Optional[Callable[[List[str]], Optional[int]]]] = {}
+
+
+def _run_in_process(
+    entry_point: Callable[[List[str]], Optional[int]], argv: List[str]
+) -> Tuple[int, str, str]:
+    """
+    Run a tool entry point with stdout/stderr captured.
+
+    Returns (returncode, stdout, stderr).
+    """
+    # Tools such as black write through sys.stdout.buffer, so capture with
+    # real text wrappers
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    stderr = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            returncode = entry_point(argv)
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:
+        # A crashing tool fails this step like a non-zero exit, not the whole run
+        stderr.write(f"{type(e).__name__}: {e}\n")
+        returncode = 1
+
+    outputs = []
+    for stream in (stdout, stderr):
+        stream.flush()
+        outputs.append(stream.buffer.getvalue().decode("utf-8"))
+    return returncode or 0, outputs[0], outputs[1]
+
+
+def _run_streaming(cmd: List[str], tool: str, show_output: bool) -> Tuple[int, str]:
+    """
+    Run cmd, echoing its stdout line by line as it arrives.
+
+    Returns (returncode, stderr).
+    """
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    assert process.stdout is not None and process.stderr is not None
+
+    # Drain stderr on a thread so a full stderr pipe cannot stall the tool
+    stderr_chunks: List[str] = []
+    stderr_pipe = process.stderr
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.extend(stderr_pipe))
+    stderr_reader.start()
+
+    printed_header = False
+    for line in process.stdout:
+        if not show_output:
+            continue
+        if not printed_header:
+            print(f"\n{tool.upper()} changes:")
+            printed_header = True
+        sys.stdout.write(line)
+    if printed_header:
+        print()
+
+    returncode = process.wait()
+    stderr_reader.join()
+    return returncode, "".join(stderr_chunks)
 
 
 def run_formatter(
@@ -41,23 +182,30 @@ def run_formatter(
     dry_run: bool = False,
     verbose: bool = False,
 ) -> bool:
-    """Run a formatting tool on files."""
+    """Run a formatting tool on files, in-process when its Python API is importable."""
+    if tool not in _TOOL_ENTRY_POINTS:
+        _TOOL_ENTRY_POINTS[tool] = _load_tool_entry_point(tool)
+    entry_point = _TOOL_ENTRY_POINTS[tool]
+
     cmd = [sys.executable, "-m", tool] + args + files
 
     if verbose:
-        print(f"Running: {' '.join(cmd)}")
+        where = " (in-process)" if entry_point is not None else ""
+        print(f"Running{where}: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if dry_run and result.stdout:
-            print(f"\n{tool.upper()} changes:")
-            print(result.stdout)
-
-        if verbose and result.stderr:
-            print(f"{tool} stderr:", result.stderr)
-
-        return result.returncode == 0
+        if entry_point is not None:
+            returncode, stdout, stderr = _run_in_process(entry_point, args + files)
+            if dry_run and stdout:
+                print(f"\n{tool.upper()} changes:")
+                print(stdout)
+        else:
+            returncode, stderr = _run_streaming(cmd, tool, show_output=dry_run)
+
+        if verbose and stderr:
+            print(f"{tool} stderr:", stderr)
+
+        return returncode == 0
     except subprocess.CalledProcessError as e:
         if verbose:
             print(f"Error running {tool}: {e}")
@@ -112,7 +260,9 @@ def apply_isort(
     return run_formatter("isort", args, files, dry_run, verbose)
 
 
-def apply_autoflake(files: List[str], dry_run: bool = False, verbose: bool = False) -> bool:
+def apply_autoflake(
+    files: List[str], dry_run: bool = False, verbose: bool = False
+) -> bool:
     """Apply autoflake to remove unused imports and variables."""
     args = [
         "--remove-all-unused-imports",
@@ -122,13 +272,17 @@ def apply_autoflake(files: List[str], dry_run: bool = False, verbose: bool = Fal
     ]
 
     if dry_run:
+        if _HAS_AUTOFLAKE:
+            return _autoflake_dry_run_in_process(files, verbose)
         args.append("--stdout")
         # For dry run, process files one by one to show changes
         success = True
         for file_path in files:
             if verbose:
                 print(f"\nChecking {file_path} with autoflake...")
-            single_success = run_formatter("autoflake", args + [file_path], [], dry_run, verbose)
+            single_success = run_formatter(
+                "autoflake", args + [file_path], [], dry_run, verbose
+            )
             success = success and single_success
         return success
     else:
@@ -136,7 +290,43 @@ def apply_autoflake(files: List[str], dry_run: bool = False, verbose: bool = Fal
         return run_formatter("autoflake", args, files, dry_run, verbose)
 
 
-def apply_autopep8(files: List[str], dry_run: bool = False, verbose: bool = False) -> bool:
+def _autoflake_dry_run_in_process(files: List[str], verbose: bool = False) -> bool:
+    """Preview autoflake changes via its fix_code API, without a subprocess per file."""
+    success = True
+    for file_path in files:
+        if verbose:
+            print(f"\nChecking {file_path} with autoflake...")
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                original = f.read()
+            fixed = autoflake.fix_code(
+                original,
+                remove_all_unused_imports=True,
+                remove_unused_variables=True,
+                remove_duplicate_keys=True,
+                expand_star_imports=True,
+            )
+        except Exception as e:
+            if verbose:
+                print(f"Error running autoflake on {file_path}: {e}")
+            success = False
+            continue
+
+        if fixed != original:
+            diff = difflib.unified_diff(
+                original.splitlines(keepends=True),
+                fixed.splitlines(keepends=True),
+                fromfile=f"{file_path}:before",
+                tofile=f"{file_path}:after",
+            )
+            print("\nAUTOFLAKE changes:")
+            print("".join(diff))
+    return success
+
+
+def apply_autopep8(
+    files: List[str], dry_run: bool = False, verbose: bool = False
+) -> bool:
     """Apply autopep8 for more aggressive fixes."""
     args = [
         "--aggressive",
@@ -152,31 +342,193 @@ def apply_autopep8(files: List[str], dry_run: bool = False, verbose: bool = Fals
     return run_formatter("autopep8", args, files, dry_run, verbose)
 
 
+def fused_pipeline_available(aggressive: bool = False) -> bool:
+    """Check whether every tool the fused per-file pipeline needs is importable."""
+    tools = ["autoflake", "black", "isort"] + (["autopep8"] if aggressive else [])
+    return all(tool_importable(tool) for tool in tools)
+
+
+@functools.lru_cache(maxsize=None)
+def _black_config(search_start: str) -> Dict[str, Any]:
+    """Return the [tool.black] settings black would load under search_start."""
+    black = importlib.import_module("black")
+    pyproject = black.find_pyproject_toml((search_start,))
+    if pyproject is None:
+        return {}
+    config: Dict[str, Any] = black.parse_pyproject_toml(pyproject)
+    return config
+
+
+def _black_mode(file_path: str, line_length: int) -> Any:
+    """
+    Build the black Mode the CLI step would use for file_path: the project's
+    [tool.black] settings, with the line length and target version that
+    apply_black passes on the command line taking precedence.
+    """
+    black = importlib.import_module("black")
+    config = _black_config(os.path.dirname(os.path.abspath(file_path)))
+    return black.Mode(
+        target_versions={black.TargetVersion.PY38},
+        line_length=line_length,
+        skip_source_first_line=bool(config.get("skip_source_first_line", False)),
+        string_normalization=not config.get("skip_string_normalization", False),
+        magic_trailing_comma=not config.get("skip_magic_trailing_comma", False),
+        preview=bool(config.get("preview", False)),
+        unstable=bool(config.get("unstable", False)),
+        enabled_features={
+            black.Preview[name] for name in config.get("enable_unstable_feature", [])
+        },
+    )
+
+
+def _fix_file_in_memory(
+    file_path: str, aggressive: bool
+) -> Tuple[str, bool, Optional[str]]:
+    """
+    Run autoflake, black, isort and (aggressive) autopep8 over one file in memory,
+    with the same options as the per-tool steps, writing it back once.
+
+    Returns (path, changed, error message).
+    """
+    black = importlib.import_module("black")
+    isort = importlib.import_module("isort")
+    line_length = 88 if aggressive else 120
+
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            original = f.read()
+            # Restore the file's own line endings on write, as the tools do
+            newline = f.newlines if isinstance(f.newlines, str) else "\n"
+
+        source = autoflake.fix_code(
+            original,
+            remove_all_unused_imports=True,
+            remove_unused_variables=True,
+            remove_duplicate_keys=True,
+            expand_star_imports=True,
+        )
+        mode = _black_mode(file_path, line_length)
+        try:
+            source = black.format_file_contents(source, fast=False, mode=mode)
+        except black.NothingChanged:
+            pass
+        isort_config = isort.Config(
+            settings_path=os.path.dirname(os.path.abspath(file_path)),
+            profile="black",
+            multi_line_output=3,
+            include_trailing_comma=True,
+            force_grid_wrap=0,
+            combine_as_imports=True,
+            line_length=line_length,
+        )
+        source = isort.code(source, config=isort_config)
+        if aggressive:
+            autopep8 = importlib.import_module("autopep8")
+            source = autopep8.fix_code(
+                source, options={"aggressive": 2, "max_line_length": 88}
+            )
+    except Exception as e:
+        return file_path, False, f"{file_path}: {e}"
+
+    if source == original:
+        return file_path, False, None
+    with open(file_path, "w", encoding="utf-8", newline=newline) as f:
+        f.write(source)
+    return file_path, True, None
+
+
+def apply_fused(
+    files: List[str], aggressive: bool = False, verbose: bool = False
+) -> bool:
+    """
+    Apply all fixes with one read and one write per file instead of one pass per tool.
+    """
+    if len(files) >= PARALLEL_FIX_THRESHOLD and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            results = list(
+                executor.map(
+                    _fix_file_in_memory, files, [aggressive] * len(files), chunksize=4
+                )
+            )
+    else:
+        results = [_fix_file_in_memory(file_path, aggressive) for file_path in files]
+
+    success = True
+    for file_path, changed, error_msg in results:
+        if error_msg is not None:
+            print(f"Fixing failed for {error_msg}")
+            success = False
+        elif verbose:
+            print(f"{'Fixed' if changed else 'Unchanged'}: {file_path}")
+    return success
+
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    """Copy src to dst as a copy-on-write reflink where supported, else a full copy."""
+    # Hardlinks are not an option: black and autopep8 rewrite files in place,
+    # which would change the backup too.
+    if _HAS_FCNTL:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return dst
+
+
 def create_backups(files: List[str], verbose: bool = False) -> None:
     """Create backup files."""
-    for file_path in files:
-        backup_path = f"{file_path}.bak"
-        shutil.copy2(file_path, backup_path)
-        if verbose:
-            print(f"Created backup: {backup_path}")
+    # Backups are I/O bound, so they are created concurrently
+    with ThreadPoolExecutor(max_workers=min(32, len(files) or 1)) as executor:
+        backup_paths = executor.map(
+            lambda file_path: _clone_or_copy(file_path, f"{file_path}.bak"), files
+        )
+        for backup_path in backup_paths:
+            if verbose:
+                print(f"Created backup: {backup_path}")
+
+
+def _compile_one(file_path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Compile one file, returning (path, error kind, error message)."""
+    try:
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                compile(b"", file_path, "exec")
+            else:
+                # compile() reads the mapped source directly (honouring any
+                # coding cookie)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                    compile(source, file_path, "exec")
+        return file_path, None, None
+    except SyntaxError as e:
+        return file_path, "syntax", f"{file_path}:{e.lineno}: {e.msg}"
+    except Exception as e:
+        return file_path, "error", f"{file_path}: {e}"
 
 
 def verify_syntax(files: List[str], verbose: bool = False) -> bool:
     """Verify Python syntax of files."""
     errors: List[str] = []
 
-    for file_path in files:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                compile(f.read(), file_path, "exec")
+    # compile() is CPU-bound, so large batches are spread across processes
+    if len(files) >= PARALLEL_SYNTAX_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_compile_one, files, chunksize=32))
+    else:
+        results = [_compile_one(file_path) for file_path in files]
+
+    for file_path, kind, error_msg in results:
+        if error_msg is None:
             if verbose:
                 print(f"✅ Syntax OK: {file_path}")
-        except SyntaxError as e:
-            error_msg = f"{file_path}:{e.lineno}: {e.msg}"
+        elif kind == "syntax":
             errors.append(error_msg)
             print(f"❌ Syntax error: {error_msg}")
-        except Exception as e:
-            error_msg = f"{file_path}: {e}"
+        else:
             errors.append(error_msg)
             print(f"❌ Error checking: {error_msg}")
 
@@ -191,26 +543,24 @@ def verify_syntax(files: List[str], verbose: bool = False) -> bool:
 def find_python_files(paths: List[str]) -> List[str]:
     """Find Python files in given paths."""
     python_files: List[str] = []
-    exclude_patterns = {
-        ".venv",
-        "venv",
-        "__pycache__",
-        ".git",
-        "target",
-        "build",
-        "dist",
-    }
 
     for path_str in paths:
         path = Path(path_str)
         if path.is_file() and path.suffix == ".py":
             python_files.append(str(path))
         elif path.is_dir():
-            for py_file in path.rglob("*.py"):
-                # Skip excluded directories
-                if any(pattern in py_file.parts for pattern in exclude_patterns):
-                    continue
-                python_files.append(str(py_file))
+            # os.scandir walk that prunes excluded directories instead of
+            # filtering every rglob result by its path parts
+            stack = [str(path)]
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.name in EXCLUDE_DIRS:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            python_files.append(entry.path)
 
     return sorted(python_files)
 
@@ -295,7 +645,9 @@ Examples:
         "autopep8": (check_tool_available("autopep8") if aggressive_mode else True),
     }
 
-    missing_tools = [tool for tool, available in tools_available.items() if not available]
+    missing_tools = [
+        tool for tool, available in tools_available.items() if not available
+    ]
     if missing_tools:
         print(f"Missing tools: {', '.join(missing_tools)}")
         print("Install with: pip install " + " ".join(missing_tools))
@@ -307,9 +659,18 @@ Examples:
 
     # Apply formatting (order matters: autoflake first, then formatting)
     success = True
+    fused = not args.dry_run and fused_pipeline_available(aggressive_mode)
+
+    if fused:
+        # Every tool is importable: run them back to back on each file in memory
+        if args.verbose:
+            print("\n🧹🖤📦 Applying all fixes per file...")
+        if not apply_fused(python_files, aggressive_mode, args.verbose):
+            print("Auto-fix pipeline failed")
+            success = False
 
     # Apply autoflake first to remove unused imports/variables
-    if tools_available["autoflake"]:
+    if not fused and tools_available["autoflake"]:
         if args.verbose:
             print("\n🧹 Removing unused imports and variables...")
         if not apply_autoflake(python_files, args.dry_run, args.verbose):
@@ -317,7 +678,7 @@ Examples:
             success = False
 
     # Apply black
-    if success:
+    if not fused and success:
         if args.verbose:
             print("\n🖤 Applying black formatting...")
         if not apply_black(python_files, aggressive_mode, args.dry_run, args.verbose):
@@ -325,7 +686,7 @@ Examples:
             success = False
 
     # Apply isort
-    if success and tools_available["isort"]:
+    if not fused and success and tools_available["isort"]:
         if args.verbose:
             print("\n📦 Organizing imports...")
         if not apply_isort(python_files, aggressive_mode, args.dry_run, args.verbose):
@@ -333,7 +694,7 @@ Examples:
             success = False
 
     # Apply autopep8 in aggressive mode for additional PEP8 fixes
-    if success and aggressive_mode and tools_available["autopep8"]:
+    if not fused and success and aggressive_mode and tools_available["autopep8"]:
         if args.verbose:
             print("\n🔧 Applying autopep8 aggressive fixes...")
         if not apply_autopep8(python_files, args.dry_run, args.verbose):
@@ -9,18 +9,60 @@ Follows project's Domain Driven Design principles with simple, focused design.
 """
 
 import argparse
+import functools
+import heapq
 import json
+import os
 import re
 import subprocess
 import sys
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+EXCLUDE_DIRS = frozenset(
+    {
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".git",
+        "target",
+        "build",
+        "dist",
+        ".tox",
+        ".pytest_cache",
+    }
+)
+# flake8 is given the same exclusions as the file walk
+_FLAKE8_EXCLUDE_ARG = "--exclude=" + ",".join(sorted(EXCLUDE_DIRS))
 
+# path:line:col: CODE message
+_FLAKE8_LINE_RE = re.compile(r"^([^:]+):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Issue:
     """Simple representation of a flake8 issue."""
 
@@ -31,7 +73,7 @@ class Issue:
     msg: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileReport:
     """Issues for a single file."""
 
@@ -47,42 +89,65 @@ class FileReport:
         return self.issue_count == 0
 
 
-def run_flake8(paths: List[str]) -> List[str]:
-    """Run flake8 and return output lines."""
+def iter_flake8_lines(paths: List[str]) -> Iterator[str]:
+    """Run flake8 and yield its output lines as they are produced."""
     cmd = [
         sys.executable,
         "-m",
         "flake8",
-        "--exclude=.venv,venv,__pycache__,.git,target,build,dist,.tox,.pytest_cache",
-    ] + paths
+        _FLAKE8_EXCLUDE_ARG,
+        "--jobs=auto",
+        # Directories are passed through so flake8 applies the project's own
+        # exclude/extend-exclude settings while walking them
+        *paths,
+    ]
+
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+    )
+    assert process.stdout is not None
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.stdout.strip().split("\n") if result.stdout.strip() else []
-    except subprocess.CalledProcessError:
-        return []
+        yield from process.stdout
+    finally:
+        # Reap flake8 even if the consumer stops early
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+        process.wait()
 
 
-def parse_flake8_output(lines: List[str], repo_root: Path) -> List[Issue]:
+def run_flake8(paths: List[str]) -> List[str]:
+    """Run flake8 and return output lines."""
+    return [line.rstrip("\n") for line in iter_flake8_lines(paths)]
+
+
+def parse_flake8_output(lines: Iterable[str], repo_root: Path) -> List[Issue]:
     """Parse flake8 output into Issue objects."""
     issues: List[Issue] = []
-    pattern = re.compile(r"^([^:]+):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$")
+    # flake8 reports many issues per file, so each distinct path is resolved once
+    rel_paths: Dict[str, str] = {}
 
     for line in lines:
-        if not line.strip():
+        stripped = line.strip()
+        # Cheap precheck: blank lines and banners without path:line:col: skip the regex
+        if stripped.count(":") < 3:
             continue
 
-        match = pattern.match(line.strip())
+        match = _FLAKE8_LINE_RE.match(stripped)
         if not match:
             continue
 
         file_path, line_num, col_num, error_code, message = match.groups()
 
         # Convert to relative path
-        try:
-            abs_path = Path(file_path).resolve()
-            rel_path = str(abs_path.relative_to(repo_root))
-        except (ValueError, OSError):
-            rel_path = file_path
+        rel_path = rel_paths.get(file_path)
+        if rel_path is None:
+            try:
+                abs_path = Path(file_path).resolve()
+                rel_path = str(abs_path.relative_to(repo_root))
+            except (ValueError, OSError):
+                rel_path = file_path
+            rel_paths[file_path] = rel_path
 
         issues.append(
             Issue(
@@ -97,82 +162,132 @@ def parse_flake8_output(lines: List[str], repo_root: Path) -> List[Issue]:
     return issues
 
 
+def _scan_py(root: str, excludes: FrozenSet[str] = EXCLUDE_DIRS) -> Iterator[str]:
+    """Yield paths of Python files under root, pruning excluded directories."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                # Also skip anything containing "venv" (e.g., myproject/.venv,
+                # project_venv)
+                if entry.name in excludes or "venv" in entry.name.lower():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_py(entry.path, excludes)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield entry.path
+    except PermissionError:
+        pass
+
+
 def find_python_files(repo_root: Path) -> List[str]:
     """Find all Python files in the repository."""
-    exclude_patterns = {
-        ".venv",
-        "venv",
-        "__pycache__",
-        ".git",
-        "target",
-        "build",
-        "dist",
-        ".tox",
-        ".pytest_cache",
-    }
-    python_files: List[str] = []
-
-    for py_file in repo_root.rglob("*.py"):
-        # Skip if any parent directory matches exclude patterns
-        rel_path_parts = py_file.relative_to(repo_root).parts
-        if any(pattern in rel_path_parts for pattern in exclude_patterns):
-            continue
-        # Also skip any path containing "venv" anywhere (e.g., myproject/.venv,
-        # .venv, project_venv)
-        if any("venv" in part.lower() for part in rel_path_parts):
-            continue
-        try:
-            rel_path = str(py_file.relative_to(repo_root))
-            python_files.append(rel_path)
-        except ValueError:
-            continue
+    root = str(repo_root)
+    return sorted(os.path.relpath(path, root) for path in _scan_py(root))
 
-    return sorted(python_files)
 
+def generate_json_report(
+    issues: List[Issue], total_py_files: int, timestamp: str
+) -> Dict[str, Any]:
+    """
+    Generate LLM-friendly JSON report.
 
-def generate_json_report(issues: List[Issue], repo_root: Path, timestamp: str) -> Dict[str, Any]:
-    """Generate LLM-friendly JSON report."""
-    # Group issues by file
-    files_with_issues: Dict[str, List[Dict[str, Any]]] = {}
+    total_py_files is the number of Python files checked.
+    """
+    # Group issues by file and count error types in a single pass
+    files_with_issues: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+    error_counts: Counter[str] = Counter()
     for issue in issues:
-        if issue.path not in files_with_issues:
-            files_with_issues[issue.path] = []
         files_with_issues[issue.path].append(
-            {
-                "line": issue.line,
-                "col": issue.col,
-                "code": issue.code,
-                "msg": issue.msg,
-            }
+            {"line": issue.line, "col": issue.col, "code": issue.code, "msg": issue.msg}
         )
+        error_counts[issue.code] += 1
 
-    # Count error types
-    error_counts = Counter(issue.code for issue in issues)
-
-    # Get all Python files for clean/total counts
-    all_python_files = find_python_files(repo_root)
     files_with_issues_count = len(files_with_issues)
-    clean_files_count = len(all_python_files) - files_with_issues_count
+    clean_files_count = total_py_files - files_with_issues_count
 
     return {
         "timestamp": timestamp,
         "summary": {
-            "total_files": len(all_python_files),
+            "total_files": total_py_files,
             "clean_files": clean_files_count,
             "files_with_issues": files_with_issues_count,
             "total_issues": len(issues),
         },
-        "files": [{"path": path, "issues": file_issues} for path, file_issues in sorted(files_with_issues.items())],
+        "files": [
+            {"path": path, "issues": file_issues}
+            for path, file_issues in sorted(files_with_issues.items())
+        ],
         "error_summary": dict(error_counts.most_common()),
     }
 
 
-def generate_human_summary(json_report: Dict[str, Any]) -> str:
-    """Generate human-readable summary from JSON report."""
+def build_summary_stats(
+    issues: List[Issue], total_py_files: int, timestamp: str
+) -> Dict[str, Any]:
+    """
+    Build just what generate_human_summary needs (counts, top error codes and the
+    five worst files) without materializing every issue as a JSON record.
+    """
+    file_counts: Counter[str] = Counter()
+    error_counts: Counter[str] = Counter()
+    for issue in issues:
+        file_counts[issue.path] += 1
+        error_counts[issue.code] += 1
+
+    # Rank in path order so ties break the same way as in the full report
+    issue_counts = ((count, path) for path, count in sorted(file_counts.items()))
+    return {
+        "timestamp": timestamp,
+        "summary": {
+            "total_files": total_py_files,
+            "clean_files": total_py_files - len(file_counts),
+            "files_with_issues": len(file_counts),
+            "total_issues": len(issues),
+        },
+        "worst_files": heapq.nlargest(5, issue_counts, key=itemgetter(0)),
+        "error_summary": dict(error_counts.most_common()),
+    }
+
+
+def write_json_report(json_report: Dict[str, Any], json_path: Path) -> None:
+    """Write the JSON report with 2-space indentation in a single write."""
+    if _HAS_ORJSON:
+        data = orjson.dumps(json_report, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(json_report, indent=2).encode("utf-8")
+    json_path.write_bytes(data)
+
+
+def report_filenames(timestamp: str) -> Tuple[str, str]:
+    """Return the (JSON report, summary) filenames for a report timestamp."""
+    file_stem = timestamp.replace(":", "")
+    return f"{file_stem}_flake8_report.json", f"{file_stem}_flake8_summary.txt"
+
+
+def generate_human_summary(
+    json_report: Dict[str, Any], json_filename: Optional[str] = None
+) -> str:
+    """
+    Generate human-readable summary from a JSON report or a
+    build_summary_stats() result.
+    """
+    if json_filename is None:
+        json_filename, _ = report_filenames(json_report["timestamp"])
     summary = json_report["summary"]
-    files = json_report["files"]
     errors = json_report["error_summary"]
 
+    # Clean run (the common case in CI): nothing to rank or recommend
+    if summary["total_issues"] == 0:
+        return "\n".join(
+            [
+                f"Flake8 Report Summary - {json_report['timestamp']}",
+                "",
+                f"✅ All {summary['total_files']} Python files are clean.",
+                "",
+                f"Full details in: {json_filename}",
+            ]
+        )
+
     # Calculate percentages
     total_files = summary["total_files"]
     clean_pct = (summary["clean_files"] / total_files * 100) if total_files > 0 else 100
@@ -191,25 +306,26 @@ def generate_human_summary(json_report: Dict[str, Any]) -> str:
 
     # Top issues
     if errors:
+        lines.append("🔥 TOP ISSUES")
+        # error_summary is already ordered most common first
         lines.extend(
-            [
-                "🔥 TOP ISSUES",
-                *[
-                    f"  {i + 1}. {code}: {count} occurrences"
-                    for i, (code, count) in enumerate(list(errors.items())[:5])
-                ],
-            ]
+            f"  {i}. {code}: {count} occurrences"
+            for i, (code, count) in enumerate(islice(errors.items(), 5), 1)
         )
         lines.append("")
 
     # Worst files
-    if files:
-        worst_files = sorted(files, key=lambda f: len(f["issues"]), reverse=True)[:5]
+    worst_files = json_report.get("worst_files")
+    if worst_files is None:
+        # Count each file's issues once; keying on the count alone keeps ties
+        # in report order
+        issue_counts = ((len(f["issues"]), f["path"]) for f in json_report["files"])
+        worst_files = heapq.nlargest(5, issue_counts, key=itemgetter(0))
+    if worst_files:
+        lines.append("📁 WORST FILES")
         lines.extend(
-            [
-                "📁 WORST FILES",
-                *[f"  {i + 1}. {f['path']}: {len(f['issues'])} issues" for i, f in enumerate(worst_files)],
-            ]
+            f"  {i}. {path}: {count} issues"
+            for i, (count, path) in enumerate(worst_files, 1)
         )
         lines.append("")
 
@@ -228,16 +344,31 @@ def generate_human_summary(json_report: Dict[str, Any]) -> str:
         [
             "  - Consider adding flake8 to pre-commit hooks",
             "",
-            f"Full details in: {
-                json_report['timestamp'].replace(
-                    ':',
-                    '')}_flake8_report.json",
+            f"Full details in: {json_filename}",
         ]
     )
 
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=8)
+def find_repo_root(start: str) -> str:
+    """
+    Return the nearest directory at or above start holding .git or Cargo.toml,
+    else the filesystem root.
+    """
+    current = start
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            return current
+        if os.path.exists(os.path.join(current, ".git")) or os.path.exists(
+            os.path.join(current, "Cargo.toml")
+        ):
+            return current
+        current = parent
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -297,36 +428,41 @@ Examples:
         return 1
 
     # Find repo root
-    repo_root = Path.cwd()
-    while repo_root.parent != repo_root:
-        if (repo_root / ".git").exists() or (repo_root / "Cargo.toml").exists():
-            break
-        repo_root = repo_root.parent
+    repo_root = Path(find_repo_root(os.getcwd()))
 
     if args.verbose:
         print(f"Repository root: {repo_root}")
         print(f"Checking paths: {args.paths}")
 
-    # Run flake8
-    flake8_output = run_flake8(args.paths)
-    issues = parse_flake8_output(flake8_output, repo_root)
+    # Run flake8, walking the repository for the clean/total counts while it runs
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        all_python_files_future = executor.submit(find_python_files, repo_root)
+        # Lines are parsed as flake8 emits them rather than after it exits
+        issues = parse_flake8_output(iter_flake8_lines(args.paths), repo_root)
+        all_python_files = all_python_files_future.result()
 
     if args.verbose:
         print(f"Found {len(issues)} flake8 issues")
 
     # Generate reports
-    timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-    json_report = generate_json_report(issues, repo_root, timestamp)
-    human_summary = generate_human_summary(json_report)
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    json_filename, summary_filename = report_filenames(timestamp)
+    if args.summary_only:
+        # No JSON will be written, so skip building the per-issue records
+        summary_stats = build_summary_stats(issues, len(all_python_files), timestamp)
+        human_summary = generate_human_summary(summary_stats, json_filename)
+    else:
+        json_report = generate_json_report(issues, len(all_python_files), timestamp)
+        human_summary = generate_human_summary(json_report, json_filename)
 
     # Handle dry-run mode
     if args.dry_run:
         print("DRY RUN - No files will be created")
         print("\nWould generate:")
         if not args.summary_only:
-            print(f"  JSON: {timestamp.replace(':', '')}_flake8_report.json")
+            print(f"  JSON: {json_filename}")
         if not args.json_only:
-            print(f"  Summary: {timestamp.replace(':', '')}_flake8_summary.txt")
+            print(f"  Summary: {summary_filename}")
         print("\nReport content:")
         print(human_summary)
         return 1 if issues else 0
@@ -338,20 +474,16 @@ Examples:
 
     # Write JSON report (LLM-friendly) unless summary-only
     if not args.summary_only:
-        json_filename = f"{timestamp.replace(':', '')}_flake8_report.json"
         json_path = args.output_dir / json_filename
-        with open(json_path, "w") as f:
-            json.dump(json_report, f, indent=2)
+        write_json_report(json_report, json_path)
         generated_files.append(f"JSON: {json_path}")
         if args.verbose:
             print(f"Generated JSON report: {json_path}")
 
     # Write human summary unless json-only
     if not args.json_only:
-        summary_filename = f"{timestamp.replace(':', '')}_flake8_summary.txt"
         summary_path = args.output_dir / summary_filename
-        with open(summary_path, "w") as f:
-            f.write(human_summary)
+        summary_path.write_text(human_summary, encoding="utf-8")
         generated_files.append(f"Summary: {summary_path}")
         if args.verbose:
             print(f"Generated summary report: {summary_path}")
@@ -11,46 +11,213 @@ Follows project's Domain Driven Design principles with simple, focused design.
 
 import argparse
 import ast
+import functools
+import hashlib
 import json
+import os
+import stat
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+IMPORT = 0  # import module [as alias]
+FROM_IMPORT = 1  # from module import name [as alias]
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_SCAN_THRESHOLD = 64
+
+EXCLUDE_DIRS = frozenset(
+    {
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".git",
+        "target",
+        "build",
+        "dist",
+    }
+)
+
+# Bump when the analysis changes so clean results from older runs are dropped
+CACHE_VERSION = 1
+
+
+class ImportRec(NamedTuple):
+    """A single imported name found in a module."""
+
+    kind: int
+    name: str
+    module: Optional[str]
+    alias: Optional[str]
+    lineno: int
+    raw_name: str
+
+    @property
+    def original(self) -> str:
+        """Render the import as it would appear in source."""
+        suffix = f" as {self.alias}" if self.alias else ""
+        if self.kind == IMPORT:
+            return f"import {self.raw_name}{suffix}"
+        return f"from {self.module} import {self.raw_name}{suffix}"
+
+
+class ScanResult(NamedTuple):
+    """Unused imports found by a worker process, or the error that stopped it."""
+
+    unused: List[ImportRec]
+    error: Optional[str]
+
+
+class CleanFileCache:
+    """On-disk record of files that had no unused imports on an earlier run.
+
+    Entries map path -> [mtime_ns, size, content digest]. A file whose mtime
+    and size still match is skipped without being read; when only the mtime
+    moved (a checkout or touch), the digest decides.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._entries: Dict[str, List[Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(cache_file.read_bytes())
+            if data["version"] == CACHE_VERSION and isinstance(data["files"], dict):
+                self._entries = data["files"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError):
+            # Unreadable or corrupt; rebuilt from scratch on save
+            self._dirty = True
+
+    def is_clean(self, file_path: str) -> bool:
+        """Return True if file_path is unchanged since it was recorded clean."""
+        entry = self._entries.get(file_path)
+        if not isinstance(entry, list) or len(entry) != 3:
+            return False
+        try:
+            st = os.stat(file_path)
+            if entry[1] != st.st_size:
+                return False
+            if entry[0] == st.st_mtime_ns:
+                return True
+            if _digest(_read_source(file_path)) != entry[2]:
+                return False
+        except (OSError, UnicodeDecodeError):
+            return False
+        entry[0] = st.st_mtime_ns
+        self._dirty = True
+        return True
+
+    def mark_clean(self, file_path: str, content: Optional[str] = None) -> None:
+        """Record file_path as having no unused imports."""
+        st = os.stat(file_path)
+        if content is None:
+            content = _read_source(file_path)
+        self._entries[file_path] = [st.st_mtime_ns, st.st_size, _digest(content)]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back if anything changed."""
+        if not self._dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_text(
+            json.dumps({"version": CACHE_VERSION, "files": self._entries})
+        )
+        self._dirty = False
 
 
 class ImportAutoFixer:
     """Simple auto-fixer using AST-based analysis for import cleanup."""
 
-    def __init__(self, verbose: bool = False, dry_run: bool = False):
+    # Refactoring name -> method that implements it
+    _REFACTORINGS: Dict[str, str] = {
+        "source.unusedImports": "_remove_unused_imports_direct",
+        "source.convertImportFormat": "_fix_import_format_direct",
+        "source.fixAll.pylance": "_apply_all_fixes_direct",
+    }
+
+    def __init__(
+        self, verbose: bool = False, dry_run: bool = False, use_cache: bool = True
+    ):
         self.verbose = verbose
         self.dry_run = dry_run
-        self.workspace_root = self._find_workspace_root()
-
-    def _find_workspace_root(self) -> str:
-        """Find the workspace root directory."""
-        current = Path.cwd()
-        while current.parent != current:
-            if (current / ".git").exists() or (current / "Cargo.toml").exists():
-                return f"file://{current}"
-            current = current.parent
-        return f"file://{Path.cwd()}"
+        self.workspace_root = _find_workspace_root(os.getcwd())
+        self._clean_cache: Optional[CleanFileCache] = None
+        if use_cache:
+            root = self.workspace_root.removeprefix("file://")
+            self._clean_cache = CleanFileCache(
+                Path(root) / ".lint-cache" / "import_autofix.json"
+            )
+        # path -> (mtime_ns, size, content, tree); reused across fix passes
+        self._ast_cache: Dict[str, Tuple[int, int, str, Optional[ast.AST]]] = {}
+        # path -> (unused imports, error) from a parallel scan, consumed once
+        self._prescanned: Dict[str, ScanResult] = {}
 
     def _log(self, message: str) -> None:
         """Log message if verbose mode is enabled."""
         if self.verbose:
             print(f"🔧 {message}")
 
+    def _get_tree(self, file_path: str) -> Tuple[str, Optional[ast.AST]]:
+        """Return (content, tree) for a file, parsing only when it changed on disk.
+
+        The tree is None when the source contains no import statement.
+        """
+        st = os.stat(file_path)
+        cached = self._ast_cache.get(file_path)
+        if (
+            cached is not None
+            and cached[0] == st.st_mtime_ns
+            and cached[1] == st.st_size
+        ):
+            return cached[2], cached[3]
+
+        content = _read_source(file_path)
+        tree = ast.parse(content) if _may_import(content) else None
+        self._ast_cache[file_path] = (st.st_mtime_ns, st.st_size, content, tree)
+        return content, tree
+
     def remove_unused_imports(self, files: List[str]) -> bool:
         """Remove unused imports using AST-based analysis."""
         success = True
         modified_files: List[str] = []
 
+        clean_cache = self._clean_cache
+        if clean_cache is not None:
+            # Files that were clean last run and have not changed need no parse
+            pending = [
+                file_path for file_path in files if not clean_cache.is_clean(file_path)
+            ]
+            if len(pending) < len(files):
+                skipped = len(files) - len(pending)
+                self._log(f"Skipping {skipped} files unchanged since a clean run")
+            files = pending
+
+        # Parsing dominates, so scan in worker processes and keep reporting
+        # and rewriting in this one to preserve output order
+        cpu_count = os.cpu_count() or 1
+        if len(files) >= PARALLEL_SCAN_THRESHOLD and cpu_count > 1:
+            chunksize = max(1, len(files) // (cpu_count * 4))
+            with ProcessPoolExecutor() as executor:
+                self._prescanned = dict(
+                    zip(
+                        files,
+                        executor.map(_scan_unused_imports, files, chunksize=chunksize),
+                    )
+                )
+
         for file_path in files:
-            file_uri = f"file://{Path(file_path).resolve()}"
             self._log(f"Removing unused imports from {file_path}")
 
             try:
                 # Use AST-based analysis to remove unused imports
-                result = self._invoke_import_refactoring("source.unusedImports", file_uri)
+                result = self._invoke_import_refactoring(
+                    "source.unusedImports", file_path
+                )
                 if result:
                     modified_files.append(file_path)
                     if not self.dry_run:
@@ -63,6 +230,13 @@ class ImportAutoFixer:
                 print(f"❌ Failed to remove unused imports from {file_path}: {e}")
                 success = False
 
+        if clean_cache is not None and not self.dry_run:
+            try:
+                clean_cache.save()
+            except OSError as e:
+                if self.verbose:
+                    print(f"Warning: Could not write {clean_cache.cache_file}: {e}")
+
         if modified_files and not self.dry_run:
             print(f"✅ Removed unused imports from {len(modified_files)} files")
         elif not self.dry_run and not modified_files:
@@ -76,11 +250,12 @@ class ImportAutoFixer:
         modified_files: List[str] = []
 
         for file_path in files:
-            file_uri = f"file://{Path(file_path).resolve()}"
             self._log(f"Fixing import format in {file_path}")
 
             try:
-                result = self._invoke_import_refactoring("source.convertImportFormat", file_uri)
+                result = self._invoke_import_refactoring(
+                    "source.convertImportFormat", file_path
+                )
                 if result:
                     modified_files.append(file_path)
                     if not self.dry_run:
@@ -106,11 +281,12 @@ class ImportAutoFixer:
         modified_files: List[str] = []
 
         for file_path in files:
-            file_uri = f"file://{Path(file_path).resolve()}"
             self._log(f"Applying all import fixes to {file_path}")
 
             try:
-                result = self._invoke_import_refactoring("source.fixAll.pylance", file_uri)
+                result = self._invoke_import_refactoring(
+                    "source.fixAll.pylance", file_path
+                )
                 if result:
                     modified_files.append(file_path)
                     if not self.dry_run:
@@ -130,7 +306,7 @@ class ImportAutoFixer:
 
         return success
 
-    def _invoke_import_refactoring(self, refactoring_name: str, file_uri: str) -> bool:
+    def _invoke_import_refactoring(self, refactoring_name: str, file_path: str) -> bool:
         """Apply import fixes using AST-based analysis."""
         try:
             # Since MCP tools are not directly available in standalone scripts,
@@ -138,49 +314,35 @@ class ImportAutoFixer:
 
             # For now, let's implement a simple check and return realistic
             # results
-            if refactoring_name == "source.unusedImports":
-                return self._remove_unused_imports_direct(file_uri)
-            elif refactoring_name == "source.convertImportFormat":
-                return self._fix_import_format_direct(file_uri)
-            elif refactoring_name == "source.fixAll.pylance":
-                return self._apply_all_fixes_direct(file_uri)
-            else:
+            method = self._REFACTORINGS.get(refactoring_name)
+            if method is None:
                 if self.verbose:
                     print(f"⚠️  Unknown refactoring: {refactoring_name}")
                 return False
+            return bool(getattr(self, method)(file_path))
 
         except Exception as e:
             if self.verbose:
-                print(f"❌ Error applying {refactoring_name} to {file_uri}: {e}")
+                print(f"❌ Error applying {refactoring_name} to {file_path}: {e}")
             return False
 
-    def _remove_unused_imports_direct(self, file_uri: str) -> bool:
+    def _remove_unused_imports_direct(self, file_path: str) -> bool:
         """Remove unused imports using AST analysis."""
-        # Convert URI to path
-        file_path = file_uri.replace("file://", "")
-
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Parse the file with AST to find imports and usage
-            tree = ast.parse(content)
-            imports = self._find_imports(tree)
-            used_names = self._find_used_names(tree)
-
-            # Find unused imports
-            unused_imports: List[Dict[str, Any]] = []
-            for imp in imports:
-                if imp["type"] == "import":
-                    # For "import module", check if "module" is used
-                    if imp["name"] not in used_names:
-                        unused_imports.append(imp)
-                elif imp["type"] == "from":
-                    # For "from module import name", check if "name" is used
-                    if imp["alias"] and imp["alias"] not in used_names:
-                        unused_imports.append(imp)
-                    elif not imp["alias"] and imp["name"] not in used_names:
-                        unused_imports.append(imp)
+            content: Optional[str] = None
+            scanned = self._prescanned.pop(file_path, None)
+            if scanned is None:
+                # Parse the file with AST to find imports and usage
+                content, tree = self._get_tree(file_path)
+                unused_imports = (
+                    _unused(*self._analyze(tree)) if tree is not None else []
+                )
+            elif scanned.error is not None:
+                if self.verbose:
+                    print(f"❌ Error analyzing {file_path}: {scanned.error}")
+                return False
+            else:
+                unused_imports = scanned.unused
 
             if unused_imports:
                 # Show what would be removed (both dry-run and regular mode)
@@ -188,33 +350,32 @@ class ImportAutoFixer:
                     print(f"📋 Would remove {
                             len(unused_imports)} unused imports from {file_path}:")
                     for imp in unused_imports:
-                        print(f"    - Line {imp['lineno']}: {imp['original']}")
+                        print(f"    - Line {imp.lineno}: {imp.original}")
                     return True  # Indicate changes would be made
                 elif self.verbose:
                     print(f"ℹ️  Found {
                             len(unused_imports)} unused imports in {file_path}")
                     for imp in unused_imports:
-                        print(f"    - Line {imp['lineno']}: {imp['original']}")
+                        print(f"    - Line {imp.lineno}: {imp.original}")
 
                 # Actually remove the unused imports (non-dry-run mode)
                 if not self.dry_run:
-                    lines = content.split("\n")
-                    # Remove lines with unused imports (in reverse order to
-                    # preserve line numbers)
-                    for imp in sorted(unused_imports, key=lambda x: x["lineno"], reverse=True):
-                        if imp["lineno"] <= len(lines):
-                            # AST line numbers are 1-based
-                            lines.pop(imp["lineno"] - 1)
-
-                    # Write back the cleaned content
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write("\n".join(lines))
+                    if content is None:
+                        content = _read_source(file_path)
+                    # Write back the content without the unused import lines
+                    _write_source(
+                        file_path,
+                        _drop_lines(content, {imp.lineno for imp in unused_imports}),
+                    )
+                    self._ast_cache.pop(file_path, None)
 
                     if self.verbose:
                         print(f"✅ Removed {
                                 len(unused_imports)} unused imports from {file_path}")
                     return True
             else:
+                if self._clean_cache is not None:
+                    self._clean_cache.mark_clean(file_path, content)
                 if self.dry_run or self.verbose:
                     print(f"ℹ️  No unused imports found in {file_path}")
                 return False
@@ -226,57 +387,81 @@ class ImportAutoFixer:
 
         return False  # Default return for all other paths
 
-    def _find_imports(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Find all import statements in the AST."""
-        imports: List[Dict[str, Any]] = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
+    @staticmethod
+    def _analyze(tree: ast.AST) -> Tuple[List[ImportRec], Set[str]]:
+        """Collect import statements and used names in a single AST walk."""
+        imports: List[ImportRec] = []
+        used_names: Set[str] = set()
+        _Import, _ImportFrom, _Name, _Attribute, _Load = (
+            ast.Import,
+            ast.ImportFrom,
+            ast.Name,
+            ast.Attribute,
+            ast.Load,
+        )
+        _AST = ast.AST
+
+        # Breadth-first like ast.walk, but iterating a list that grows as
+        # children are appended avoids the deque, the generator and the
+        # per-node child list, and leaf-like nodes are not expanded at all
+        nodes: List[ast.AST] = [tree]
+        append = nodes.append
+        for node in nodes:
+            # Exact type checks are cheaper than isinstance and still narrow
+            # the node for the type checker
+            if type(node) is _Name:
+                if type(node.ctx) is _Load:
+                    used_names.add(node.id)
+                continue
+            elif type(node) is _Attribute:
+                # For attribute access like "module.function", add "module"
+                target = node.value
+                while type(target) is _Attribute:
+                    target = target.value
+                if type(target) is _Name:
+                    used_names.add(target.id)
+            elif type(node) is _Import:
+                lineno = node.lineno
                 for alias in node.names:
                     imports.append(
-                        {
-                            "type": "import",
-                            "name": alias.asname or alias.name,
-                            "module": alias.name,
-                            "alias": alias.asname,
-                            "lineno": node.lineno,
-                            "original": f"import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""),
-                        }
+                        ImportRec(
+                            IMPORT,
+                            alias.asname or alias.name,
+                            alias.name,
+                            alias.asname,
+                            lineno,
+                            alias.name,
+                        )
                     )
-            elif isinstance(node, ast.ImportFrom):
+                continue
+            elif type(node) is _ImportFrom:
+                lineno, module = node.lineno, node.module
                 for alias in node.names:
                     imports.append(
-                        {
-                            "type": "from",
-                            "name": alias.asname or alias.name,
-                            "module": node.module,
-                            "alias": alias.asname,
-                            "lineno": node.lineno,
-                            "original": f"from {
-                                node.module} import {
-                                alias.name}" + (f" as {
-                                    alias.asname}" if alias.asname else ""),
-                        }
+                        ImportRec(
+                            FROM_IMPORT,
+                            alias.asname or alias.name,
+                            module,
+                            alias.asname,
+                            lineno,
+                            alias.name,
+                        )
                     )
-        return imports
+                continue
 
-    def _find_used_names(self, tree: ast.AST) -> Set[str]:
-        """Find all names used in the code (excluding imports and definitions)."""
-        used_names: Set[str] = set()
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                used_names.add(node.id)
-            elif isinstance(node, ast.Attribute):
-                # For attribute access like "module.function", add "module"
-                if isinstance(node.value, ast.Name):
-                    used_names.add(node.value.id)
+            for field in node._fields:
+                value = getattr(node, field, None)
+                if type(value) is list:
+                    for item in value:
+                        if isinstance(item, _AST):
+                            append(item)
+                elif isinstance(value, _AST):
+                    append(value)
 
-        return used_names
+        return imports, used_names
 
-    def _fix_import_format_direct(self, file_uri: str) -> bool:
+    def _fix_import_format_direct(self, file_path: str) -> bool:
         """Fix import format using direct file analysis."""
-        file_path = file_uri.replace("file://", "")
-
         if self.dry_run:
             print(f"📋 Would check import format in {file_path} (placeholder - no changes detected)")  # noqa: E501
             return False
@@ -287,10 +472,8 @@ class ImportAutoFixer:
             print(f"ℹ️  Import format check for {file_path} (placeholder)")
         return False
 
-    def _apply_all_fixes_direct(self, file_uri: str) -> bool:
+    def _apply_all_fixes_direct(self, file_path: str) -> bool:
         """Apply all available fixes using direct file analysis."""
-        file_path = file_uri.replace("file://", "")
-
         if self.dry_run:
             print(
                 f"📋 Would apply additional import fixes to {file_path} (placeholder - no changes detected)"  # noqa: E501
@@ -313,13 +496,14 @@ class ImportAutoFixer:
 
         # Read existing settings or create new ones
         settings: dict[str, object] = {}
-        if settings_file.exists():
-            try:
-                with open(settings_file, "r") as f:
-                    settings = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                if self.verbose:
-                    print(f"Warning: Could not read existing settings: {e}")
+        try:
+            # One read of the whole file; json.loads uses the C scanner
+            settings = json.loads(settings_file.read_bytes())
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            if self.verbose:
+                print(f"Warning: Could not read existing settings: {e}")
 
         # Update Python analysis settings
         python_settings: dict[str, object] = {
@@ -341,8 +525,7 @@ class ImportAutoFixer:
             return True
 
         try:
-            with open(settings_file, "w") as f:
-                json.dump(settings, f, indent=2)
+            settings_file.write_text(json.dumps(settings, indent=2))
             print(f"✅ Updated VS Code settings in {settings_file}")
             return True
         except IOError as e:
@@ -350,21 +533,133 @@ class ImportAutoFixer:
             return False
 
 
+@functools.lru_cache(maxsize=8)
+def _find_workspace_root(cwd: str) -> str:
+    """Find the workspace root directory above cwd; the walk runs once per cwd."""
+    current = cwd
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            return f"file://{cwd}"
+        if os.path.exists(os.path.join(current, ".git")) or os.path.exists(
+            os.path.join(current, "Cargo.toml")
+        ):
+            return f"file://{current}"
+        current = parent
+
+
+def _read_source(file_path: str) -> str:
+    """Read a file as UTF-8 with a single os.read, bypassing the text I/O stack.
+
+    Line endings are kept as they are on disk, so rewrites use newline="".
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) > size:
+            # The file grew after fstat; read the rest
+            chunks = [data]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8")
+
+
+def _write_source(file_path: str, content: str) -> None:
+    """Replace a file's content atomically, keeping its permissions.
+
+    A killed run leaves either the old or the new file, never a truncated one.
+    Symlinks are followed so the link itself is kept.
+    """
+    target = os.path.realpath(file_path)
+    # Use a uniquely named temporary file next to the target for atomic writes
+    fd, temp_file = tempfile.mkstemp(
+        dir=os.path.dirname(target),
+        prefix=f".{os.path.basename(target)}.",
+        suffix=".tmp",
+    )
+    data = memoryview(content.encode("utf-8"))
+    try:
+        try:
+            os.fchmod(fd, stat.S_IMODE(os.stat(target).st_mode))
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+        finally:
+            os.close(fd)
+        # Atomic move - replace original file
+        os.replace(temp_file, target)
+    except BaseException:
+        try:
+            os.unlink(temp_file)
+        except OSError:
+            pass
+        raise
+
+
+def _digest(content: str) -> str:
+    """Return a short content digest for the clean-file cache."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _may_import(content: str) -> bool:
+    """Cheap pre-parse check: every import statement contains the keyword."""
+    return "import" in content
+
+
+def _unused(imports: List[ImportRec], used_names: Set[str]) -> List[ImportRec]:
+    """Return the imports whose bound name is never used."""
+    # "name" is the alias when present, else the imported module or symbol
+    return [rec for rec in imports if rec.name not in used_names]
+
+
+def _drop_lines(content: str, linenos: Set[int]) -> str:
+    """Return content without the given 1-based lines.
+
+    Newlines are only scanned up to the last dropped line; the kept spans
+    between dropped lines are copied as whole slices.
+    """
+    pieces: List[str] = []
+    kept_from = line_start = 0
+    line = 1
+    for lineno in sorted(linenos):
+        while line < lineno:
+            newline = content.find("\n", line_start)
+            if newline < 0:
+                # Past the last line; nothing more to drop
+                pieces.append(content[kept_from:])
+                return "".join(pieces)
+            line_start = newline + 1
+            line += 1
+        pieces.append(content[kept_from:line_start])
+        newline = content.find("\n", line_start)
+        kept_from = line_start = len(content) if newline < 0 else newline + 1
+        line += 1
+    pieces.append(content[kept_from:])
+    return "".join(pieces)
+
+
+def _scan_unused_imports(file_path: str) -> ScanResult:
+    """Parse one file in a worker process, returning its unused imports or the error."""
+    try:
+        content = _read_source(file_path)
+        if not _may_import(content):
+            return ScanResult([], None)
+        tree = ast.parse(content)
+    except Exception as e:
+        return ScanResult([], str(e))
+    return ScanResult(_unused(*ImportAutoFixer._analyze(tree)), None)
+
+
 def find_python_files(paths: List[str]) -> List[str]:
     """Find Python files in given paths.
 
     Excludes __init__.py files to preserve re-export imports.
     """
     python_files: List[str] = []
-    exclude_patterns = {
-        ".venv",
-        "venv",
-        "__pycache__",
-        ".git",
-        "target",
-        "build",
-        "dist",
-    }
 
     for path_str in paths:
         path = Path(path_str)
@@ -373,14 +668,23 @@ def find_python_files(paths: List[str]) -> List[str]:
             if path.name != "__init__.py":
                 python_files.append(str(path.resolve()))
         elif path.is_dir():
-            for py_file in path.rglob("*.py"):
-                # Skip excluded directories
-                if any(pattern in py_file.parts for pattern in exclude_patterns):
-                    continue
-                # Skip __init__.py files (they contain re-export imports)
-                if py_file.name == "__init__.py":
-                    continue
-                python_files.append(str(py_file.resolve()))
+            # os.scandir walk that prunes excluded directories; resolving the
+            # root once keeps every entry path absolute
+            stack = [str(path.resolve())]
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.name in EXCLUDE_DIRS:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        # Skip __init__.py files (they contain re-export imports)
+                        elif (
+                            entry.name.endswith(".py")
+                            and entry.name != "__init__.py"
+                            and entry.is_file()
+                        ):
+                            python_files.append(entry.path)
 
     return sorted(python_files)
 
@@ -397,6 +701,7 @@ Examples:
   %(prog)s --import-format-only         # Fix only import format
   %(prog)s --dry-run                    # Preview changes without applying
   %(prog)s --configure-workspace        # Update VS Code settings for Python paths
+  %(prog)s --no-cache                   # Re-check files that were clean last run
   %(prog)s --verbose src/               # Detailed output while processing src/
         """,
     )
@@ -433,6 +738,11 @@ Examples:
         action="store_true",
         help="Show changes without applying them",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every file instead of skipping ones that were clean last run",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -443,7 +753,9 @@ Examples:
     args = parser.parse_args()
 
     # Create auto-fixer instance
-    fixer = ImportAutoFixer(verbose=args.verbose, dry_run=args.dry_run)
+    fixer = ImportAutoFixer(
+        verbose=args.verbose, dry_run=args.dry_run, use_cache=not args.no_cache
+    )
 
     # Configure workspace if requested
     if args.configure_workspace:
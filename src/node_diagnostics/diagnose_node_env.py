@@ -16,10 +16,14 @@ Exit codes:
 """
 
 import argparse
-import json
 import os
 import platform
+import re
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -28,6 +32,16 @@ from typing import Any, Optional
 from shared_libs.cmd_utils.subprocess_client import CommandConfig, SubprocessClient
 from shared_libs.common.logging_utils import setup_logging
 
+# Seconds a cached command output stays valid
+VERSION_CACHE_TTL = 60
+NPM_LIST_CACHE_TTL = 300
+
+# Major version of "v22.11.0" or "22.11.0"
+NODE_VERSION_RE = re.compile(r"\s*v*\s*(\d+)\s*(?:\.|$)")
+
+# Horizontal rule used by section headers and the exit footer
+HEADER_BAR = "=" * 60
+
 
 @dataclass
 class Command:
@@ -61,16 +75,93 @@ class Issue:
     commands: list[str] = field(default_factory=list)
 
 
+class ResultCache:
+    """Cross-run cache of successful command output, keyed by cwd, argv and resolved binary.
+
+    An entry is reused while it is younger than its TTL and the binary's mtime
+    is unchanged. Version managers can change what a binary reports without
+    touching it (Volta shims, project pins), so the cache is opt-in and shims
+    are never cached; see NodeDiagnostics._run_cached.
+    """
+
+    def __init__(self, cache_file: Path) -> None:
+        """Load cached entries; a missing or corrupt file starts empty."""
+        # Imported here so runs without --cache never load json
+        import json
+
+        self.cache_file = cache_file
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            data = json.loads(cache_file.read_bytes())
+            if isinstance(data, dict):
+                self._entries = data
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _key(argv: list[str], binary: str) -> str:
+        """Build the entry key for argv run through binary from the current directory."""
+        # The working directory is part of the key because project-level
+        # version pins (package.json, .nvmrc, .tool-versions) depend on it
+        return "\0".join([os.getcwd(), binary, *argv])
+
+    def get(self, argv: list[str], binary: str, ttl: float) -> Optional[str]:
+        """Return cached output for argv if still fresh, else None."""
+        entry = self._entries.get(self._key(argv, binary))
+        if entry is None:
+            return None
+        try:
+            if time.time() - entry["timestamp"] >= ttl or os.stat(binary).st_mtime_ns != entry["mtime_ns"]:
+                return None
+            return str(entry["output"])
+        except (OSError, KeyError, TypeError):
+            return None
+
+    def put(self, argv: list[str], binary: str, output: str) -> None:
+        """Record the output of a successful run of argv."""
+        try:
+            mtime_ns = os.stat(binary).st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            self._entries[self._key(argv, binary)] = {"timestamp": time.time(), "mtime_ns": mtime_ns, "output": output}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back if anything changed; failures are ignored."""
+        if not self._dirty:
+            return
+        import json
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(self._entries))
+            self._dirty = False
+        except OSError:
+            pass
+
+
+def default_cache_file() -> Path:
+    """Return the cache location, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "dev-toolkit" / "node_diag.json"
+
+
 class NodeDiagnostics:
     """Diagnose Node.js environment."""
 
-    def __init__(self, verbose: bool = False, logger: Optional[Any] = None) -> None:
+    def __init__(self, verbose: bool = False, logger: Optional[Any] = None, use_cache: bool = False) -> None:
         """Initialize diagnostics."""
         self.verbose = verbose
+        self.cache: Optional[ResultCache] = ResultCache(default_cache_file()) if use_cache else None
         self.logger = logger
         self.results: dict[str, DiagnosticResult] = {}
         self.issues: list[Issue] = []
         self.system_info = self._get_system_info()
+        # PATH split once, in order, without repeated or empty entries
+        self._path_entries = [entry for entry in dict.fromkeys(os.environ.get("PATH", "").split(os.pathsep)) if entry]
 
         # Setup subprocess client
         config = CommandConfig(
@@ -91,41 +182,88 @@ class NodeDiagnostics:
         }
 
     def _find_all_instances(self, command: str) -> list[str]:
-        """Find all instances of a command in PATH."""
-        if platform.system() == "Windows":
-            # Windows uses 'where' command
-            result = self.subprocess_client.execute_command(["where", command])
-        else:
-            # Unix-like systems use 'which -a'
-            result = self.subprocess_client.execute_command(["which", "-a", command])
-
-        if result.success:
-            paths = [p.strip() for p in result.output.strip().split("\n") if p.strip()]
-            return paths
-        return []
+        """Find all instances of a command in PATH (like 'which -a' / 'where')."""
+        names = [command]
+        if self.system_info["platform"] == "Windows" and not os.path.splitext(command)[1]:
+            # Windows resolves bare names through PATHEXT
+            extensions = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep)
+            names = [command + ext for ext in extensions if ext]
+
+        paths: list[str] = []
+        for entry in self._path_entries:
+            for name in names:
+                candidate = os.path.join(entry, name)
+                if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                    paths.append(candidate)
+        return paths
 
     def check_command(self, cmd: Command) -> DiagnosticResult:
         """Check if command exists and get version."""
-        # Check if command exists
-        result = self.subprocess_client.execute_command(["which", cmd.name])
+        return self.check_commands([cmd])[0]
+
+    def check_commands(self, commands: list[Command]) -> list[DiagnosticResult]:
+        """Check several commands, running their version calls concurrently."""
+        # PATH lookups are done in-process; only the version calls spawn
+        which_paths = [shutil.which(cmd.name) for cmd in commands]
+        found = [(cmd, which_path) for cmd, which_path in zip(commands, which_paths) if which_path]
+        version_outputs: dict[str, Optional[str]] = {}
+        if found:
+            with ThreadPoolExecutor(max_workers=len(found)) as executor:
+                version_outputs = dict(
+                    zip(
+                        [cmd.name for cmd, _ in found],
+                        executor.map(
+                            lambda item: self._run_cached(item[0].cmd, item[1], VERSION_CACHE_TTL),
+                            found,
+                        ),
+                    )
+                )
 
+        return [
+            self._build_result(cmd, which_path, version_outputs.get(cmd.name))
+            for cmd, which_path in zip(commands, which_paths)
+        ]
+
+    def _run_cached(self, argv: list[str], binary: str, ttl: float) -> Optional[str]:
+        """Return the output of a successful run of argv, reusing a fresh cached one."""
+        binary = os.path.realpath(binary)
+        # Volta points node, npm, etc. at one shim that picks the version from
+        # the default toolchain and the project pin, neither of which changes
+        # the shim itself, so its output is never cached
+        cache = self.cache if not os.path.basename(binary).startswith("volta-shim") else None
+        if cache is not None:
+            output = cache.get(argv, binary, ttl)
+            if output is not None:
+                if self.verbose:
+                    print(f"Using cached output: {' '.join(argv)}")
+                return output
+
+        result = self.subprocess_client.execute_command(argv)
         if not result.success:
+            return None
+        if cache is not None:
+            cache.put(argv, binary, result.output)
+        return result.output
+
+    def _build_result(
+        self,
+        cmd: Command,
+        which_path: Optional[str],
+        version_output: Optional[str],
+    ) -> DiagnosticResult:
+        """Assemble a DiagnosticResult from the PATH lookup and version call."""
+        if not which_path:
             return DiagnosticResult(
                 command=cmd.name,
                 found=False,
                 error=f"{cmd.name} not found in PATH",
             )
 
-        which_path = result.output.strip()
-
         # Get all instances
         all_paths = self._find_all_instances(cmd.name)
 
         # Get version
-        version_result = self.subprocess_client.execute_command(cmd.cmd)
-        version = None
-        if version_result.success:
-            version = version_result.output.strip()
+        version = version_output.strip() if version_output is not None else None
 
         return DiagnosticResult(
             command=cmd.name,
@@ -137,11 +275,17 @@ class NodeDiagnostics:
 
     def check_path_config(self) -> dict[str, Any]:
         """Check PATH configuration."""
-        path_env = os.environ.get("PATH", "")
-        path_entries = path_env.split(os.pathsep)
-
-        volta_in_path = any("volta" in entry.lower() for entry in path_entries)
-        npm_global_in_path = any(".npm-global" in entry or "npm/bin" in entry for entry in path_entries)
+        path_entries = self._path_entries
+
+        # One pass for both flags, stopping once both are known
+        volta_in_path = npm_global_in_path = False
+        for entry in path_entries:
+            if not volta_in_path and "volta" in entry.lower():
+                volta_in_path = True
+            if not npm_global_in_path and (".npm-global" in entry or "npm/bin" in entry):
+                npm_global_in_path = True
+            if volta_in_path and npm_global_in_path:
+                break
 
         return {
             "volta_in_path": volta_in_path,
@@ -159,25 +303,28 @@ class NodeDiagnostics:
 
     def check_node_version_requirement(self, version_str: Optional[str]) -> tuple[bool, int]:
         """Check if Node.js meets minimum version requirement (18+)."""
-        if not version_str:
+        match = NODE_VERSION_RE.match(version_str or "")
+        if not match:
             return False, 0
 
-        # Extract version number (handle "v22.11.0" or "22.11.0")
-        version_str = version_str.strip().lstrip("v")
-        try:
-            major = int(version_str.split(".")[0])
-            return major >= 18, major
-        except (ValueError, IndexError):
-            return False, 0
+        major = int(match.group(1))
+        return major >= 18, major
 
     def check_npm_global_packages(self) -> dict[str, Any]:
         """Check installed npm global packages."""
-        result = self.subprocess_client.execute_command(["npm", "list", "-g", "--depth=0", "--json"])
-        if not result.success:
+        npm_result = self.results.get("npm")
+        npm_path = npm_result.path if npm_result and npm_result.path else shutil.which("npm")
+        output = None
+        if npm_path:
+            output = self._run_cached(["npm", "list", "-g", "--depth=0", "--json"], npm_path, NPM_LIST_CACHE_TTL)
+        if output is None:
             return {"error": "Failed to list npm packages"}
 
+        # json is only needed here and by ResultCache, so default runs skip importing it
+        import json
+
         try:
-            data = json.loads(result.output)
+            data = json.loads(output)
             dependencies = data.get("dependencies", {})
             return {
                 "count": len(dependencies),
@@ -189,10 +336,13 @@ class NodeDiagnostics:
 
     def analyze_issues(self) -> None:
         """Analyze results and identify issues."""
+        results = self.results
+        add_issue = self.issues.append
+
         # Check Node.js installation
-        node_result = self.results.get("node")
+        node_result = results.get("node")
         if not node_result or not node_result.found:
-            self.issues.append(
+            add_issue(
                 Issue(
                     severity="critical",
                     message="Node.js is not installed",
@@ -209,13 +359,16 @@ class NodeDiagnostics:
                 )
             )
         else:
+            node_version = node_result.version
+            install_count = len(node_result.all_paths)
+
             # Check version
-            meets_req, major_version = self.check_node_version_requirement(node_result.version)
+            meets_req, major_version = self.check_node_version_requirement(node_version)
             if not meets_req:
-                self.issues.append(
+                add_issue(
                     Issue(
                         severity="critical",
-                        message=f"Node.js version too old: {node_result.version}",
+                        message=f"Node.js version too old: {node_version}",
                         recommendation="Upgrade to Node.js 18+ (22 LTS recommended)",
                         commands=[
                             "volta install node@22  # Recommended",
@@ -224,21 +377,21 @@ class NodeDiagnostics:
                     )
                 )
             elif major_version < 22:
-                self.issues.append(
+                add_issue(
                     Issue(
                         severity="info",
-                        message=f"Node.js {node_result.version} meets minimum requirements",
+                        message=f"Node.js {node_version} meets minimum requirements",
                         recommendation="Consider upgrading to Node.js 22 LTS for improved performance",
                         commands=["volta install node@22"],
                     )
                 )
 
             # Check for multiple Node.js installations
-            if len(node_result.all_paths) > 1:
-                self.issues.append(
+            if install_count > 1:
+                add_issue(
                     Issue(
                         severity="warning",
-                        message=f"Multiple Node.js installations detected: {len(node_result.all_paths)}",
+                        message=f"Multiple Node.js installations detected: {install_count}",
                         recommendation="Consider using Volta exclusively to avoid version conflicts",
                         commands=[
                             "# Remove Homebrew Node.js:",
@@ -254,9 +407,9 @@ class NodeDiagnostics:
                 )
 
         # Check npm
-        npm_result = self.results.get("npm")
+        npm_result = results.get("npm")
         if not npm_result or not npm_result.found:
-            self.issues.append(
+            add_issue(
                 Issue(
                     severity="critical",
                     message="npm is not installed",
@@ -266,9 +419,9 @@ class NodeDiagnostics:
             )
 
         # Check Volta
-        volta_result = self.results.get("volta")
+        volta_result = results.get("volta")
         if not volta_result or not volta_result.found:
-            self.issues.append(
+            add_issue(
                 Issue(
                     severity="info",
                     message="Volta is not installed (optional but recommended)",
@@ -284,7 +437,7 @@ class NodeDiagnostics:
             # Check if Node.js is managed by Volta
             if node_result and node_result.path:
                 if "volta" not in node_result.path.lower():
-                    self.issues.append(
+                    add_issue(
                         Issue(
                             severity="warning",
                             message="Volta installed but Node.js not managed by Volta",
@@ -298,9 +451,7 @@ class NodeDiagnostics:
 
     def print_header(self, text: str) -> None:
         """Print section header."""
-        print(f"\n{'=' * 60}")
-        print(f"  {text}")
-        print(f"{'=' * 60}")
+        print(f"\n{HEADER_BAR}\n  {text}\n{HEADER_BAR}")
 
     def print_result(self, result: DiagnosticResult) -> None:
         """Print diagnostic result."""
@@ -320,47 +471,34 @@ class NodeDiagnostics:
             if result.error:
                 print(f"   Error: {result.error}")
 
-    def print_issues(self) -> None:
+    def group_issues(self) -> dict[str, list[Issue]]:
+        """Group issues by severity in a single pass, keeping their order."""
+        groups: dict[str, list[Issue]] = {"critical": [], "warning": [], "info": []}
+        for issue in self.issues:
+            groups.setdefault(issue.severity, []).append(issue)
+        return groups
+
+    def print_issues(self, groups: Optional[dict[str, list[Issue]]] = None) -> None:
         """Print identified issues."""
         if not self.issues:
             self.print_header("DIAGNOSIS: HEALTHY ✓")
             print("\nNo issues detected. Your Node.js environment is properly configured.")
             return
 
-        # Group by severity
-        critical = [i for i in self.issues if i.severity == "critical"]
-        warnings = [i for i in self.issues if i.severity == "warning"]
-        info = [i for i in self.issues if i.severity == "info"]
+        if groups is None:
+            groups = self.group_issues()
 
-        if critical:
-            self.print_header("CRITICAL ISSUES")
-            for idx, issue in enumerate(critical, 1):
+        for severity, title in (("critical", "CRITICAL ISSUES"), ("warning", "WARNINGS"), ("info", "RECOMMENDATIONS")):
+            issues = groups.get(severity)
+            if not issues:
+                continue
+            self.print_header(title)
+            for idx, issue in enumerate(issues, 1):
                 print(f"\n{idx}. {issue.message}")
                 print(f"   → {issue.recommendation}")
                 if issue.commands:
                     print("   Commands:")
-                    for cmd in issue.commands:
-                        print(f"     {cmd}")
-
-        if warnings:
-            self.print_header("WARNINGS")
-            for idx, issue in enumerate(warnings, 1):
-                print(f"\n{idx}. {issue.message}")
-                print(f"   → {issue.recommendation}")
-                if issue.commands:
-                    print("   Commands:")
-                    for cmd in issue.commands:
-                        print(f"     {cmd}")
-
-        if info:
-            self.print_header("RECOMMENDATIONS")
-            for idx, issue in enumerate(info, 1):
-                print(f"\n{idx}. {issue.message}")
-                print(f"   → {issue.recommendation}")
-                if issue.commands:
-                    print("   Commands:")
-                    for cmd in issue.commands:
-                        print(f"     {cmd}")
+                    sys.stdout.writelines(f"     {cmd}\n" for cmd in issue.commands)
 
     def run(self) -> int:
         """Run all diagnostics and return exit code."""
@@ -375,48 +513,58 @@ class NodeDiagnostics:
             Command("volta", ["volta", "--version"], required=False),
         ]
 
-        for cmd in commands:
-            result = self.check_command(cmd)
-            self.results[cmd.name] = result
-            self.print_result(result)
-
-        # Check PATH configuration
-        if self.verbose:
-            self.print_header("PATH CONFIGURATION")
-            path_config = self.check_path_config()
-            print(f"Volta in PATH: {path_config['volta_in_path']}")
-            print(f"npm global in PATH: {path_config['npm_global_in_path']}")
-
-            volta_home = self.check_volta_home()
-            if volta_home:
-                print(f"VOLTA_HOME: {volta_home}")
-            else:
-                print("VOLTA_HOME: Not set or invalid")
-
-        # Check npm packages
-        if self.results.get("npm", DiagnosticResult("npm", False)).found:
+        with ThreadPoolExecutor(max_workers=1) as background:
+            # npm list -g is the slowest call, so start it before the tool
+            # checks; check_npm_global_packages finds npm on PATH itself
+            npm_packages = background.submit(self.check_npm_global_packages) if self.verbose else None
+
+            for cmd, result in zip(commands, self.check_commands(commands)):
+                self.results[cmd.name] = result
+                self.print_result(result)
+
+            # Check PATH configuration. These checks are in-process (microseconds),
+            # so they run inline while npm list is still going in the background;
+            # the pool is only left (and waited on) after the npm section
             if self.verbose:
-                self.print_header("NPM GLOBAL PACKAGES")
-                pkg_info = self.check_npm_global_packages()
-                if "error" not in pkg_info:
-                    print(f"Count: {pkg_info['count']}")
-                    print(f"Location: {pkg_info.get('location', 'unknown')}")
-                    if pkg_info.get("packages"):
-                        print("\nPackages:")
-                        for pkg in sorted(pkg_info["packages"]):
-                            print(f"  - {pkg}")
+                self.print_header("PATH CONFIGURATION")
+                path_config = self.check_path_config()
+                print(f"Volta in PATH: {path_config['volta_in_path']}")
+                print(f"npm global in PATH: {path_config['npm_global_in_path']}")
+
+                volta_home = self.check_volta_home()
+                if volta_home:
+                    print(f"VOLTA_HOME: {volta_home}")
                 else:
-                    print(f"Error: {pkg_info['error']}")
+                    print("VOLTA_HOME: Not set or invalid")
+
+            # Check npm packages
+            if self.results.get("npm", DiagnosticResult("npm", False)).found:
+                if npm_packages is not None:
+                    self.print_header("NPM GLOBAL PACKAGES")
+                    pkg_info = npm_packages.result()
+                    if "error" not in pkg_info:
+                        print(f"Count: {pkg_info['count']}")
+                        print(f"Location: {pkg_info.get('location', 'unknown')}")
+                        if pkg_info.get("packages"):
+                            print("\nPackages:")
+                            for pkg in sorted(pkg_info["packages"]):
+                                print(f"  - {pkg}")
+                    else:
+                        print(f"Error: {pkg_info['error']}")
+
+        if self.cache is not None:
+            self.cache.save()
 
         # Analyze and print issues
         self.analyze_issues()
-        self.print_issues()
+        groups = self.group_issues()
+        self.print_issues(groups)
 
         # Determine exit code
-        critical_count = sum(1 for i in self.issues if i.severity == "critical")
-        warning_count = sum(1 for i in self.issues if i.severity == "warning")
+        critical_count = len(groups["critical"])
+        warning_count = len(groups["warning"])
 
-        print("\n" + "=" * 60)
+        print(f"\n{HEADER_BAR}")
         if critical_count > 0:
             print(f"EXIT: CRITICAL ({critical_count} critical issues)")
             return 1
@@ -442,6 +590,7 @@ Exit codes:
 Examples:
   %(prog)s              # Basic check
   %(prog)s --verbose    # Detailed analysis
+  %(prog)s --cache      # Reuse recent tool versions
         """,
     )
     parser.add_argument(
@@ -450,6 +599,11 @@ Examples:
         action="store_true",
         help="Enable verbose output with detailed diagnostics",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse version checks from recent runs (not applied to Volta shims)",
+    )
 
     args = parser.parse_args()
 
@@ -464,7 +618,7 @@ Examples:
         logger.info("Starting Node.js environment diagnostics")
         logger.info(f"Platform: {platform.system()} {platform.release()}")
 
-    diagnostics = NodeDiagnostics(verbose=args.verbose, logger=logger)
+    diagnostics = NodeDiagnostics(verbose=args.verbose, logger=logger, use_cache=args.cache)
     exit_code = diagnostics.run()
 
     if args.verbose:
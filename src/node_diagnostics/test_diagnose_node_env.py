@@ -0,0 +1,126 @@
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+# Make shared_libs importable when run from this directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from diagnose_node_env import DiagnosticResult, NodeDiagnostics, ResultCache  # noqa: E402
+
+ARGV = ["node", "--version"]
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_file = Path(self.tmp.name) / "cache" / "node_diag.json"
+        self.binary = os.path.join(self.tmp.name, "node")
+        with open(self.binary, "w") as f:
+            f.write("#!/bin/sh\n")
+
+    def test_hit_after_put_and_reload(self) -> None:
+        cache = ResultCache(self.cache_file)
+        self.assertIsNone(cache.get(ARGV, self.binary, 60))
+        cache.put(ARGV, self.binary, "v22.11.0")
+        self.assertEqual(cache.get(ARGV, self.binary, 60), "v22.11.0")
+
+        cache.save()
+        self.assertEqual(ResultCache(self.cache_file).get(ARGV, self.binary, 60), "v22.11.0")
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = ResultCache(self.cache_file)
+        with patch("diagnose_node_env.time.time", return_value=1000.0):
+            cache.put(ARGV, self.binary, "v22.11.0")
+        with patch("diagnose_node_env.time.time", return_value=1059.0):
+            self.assertEqual(cache.get(ARGV, self.binary, 60), "v22.11.0")
+        with patch("diagnose_node_env.time.time", return_value=1060.0):
+            self.assertIsNone(cache.get(ARGV, self.binary, 60))
+
+    def test_binary_change_invalidates_entry(self) -> None:
+        cache = ResultCache(self.cache_file)
+        cache.put(ARGV, self.binary, "v22.11.0")
+        stat = os.stat(self.binary)
+        os.utime(self.binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(cache.get(ARGV, self.binary, 60))
+
+    def test_entries_are_keyed_on_working_directory(self) -> None:
+        cache = ResultCache(self.cache_file)
+        with patch("diagnose_node_env.os.getcwd", return_value="/projects/a"):
+            cache.put(ARGV, self.binary, "v22.11.0")
+        with patch("diagnose_node_env.os.getcwd", return_value="/projects/b"):
+            self.assertIsNone(cache.get(ARGV, self.binary, 60))
+
+    def test_corrupt_cache_file_starts_empty(self) -> None:
+        self.cache_file.parent.mkdir(parents=True)
+        self.cache_file.write_text("{not json")
+        self.assertIsNone(ResultCache(self.cache_file).get(ARGV, self.binary, 60))
+
+
+class TestRunCached(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.diagnostics = NodeDiagnostics()
+        self.diagnostics.cache = ResultCache(Path(self.tmp.name) / "node_diag.json")
+        self.run_mock = MagicMock(return_value=MagicMock(success=True, output="v22.11.0"))
+        self.diagnostics.subprocess_client.execute_command = self.run_mock  # type: ignore[method-assign]
+
+    def _binary(self, name: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n")
+        return path
+
+    def test_cache_is_off_by_default(self) -> None:
+        self.assertIsNone(NodeDiagnostics().cache)
+
+    def test_second_call_served_from_cache(self) -> None:
+        binary = self._binary("node")
+        self.assertEqual(self.diagnostics._run_cached(ARGV, binary, 60), "v22.11.0")
+        self.assertEqual(self.diagnostics._run_cached(ARGV, binary, 60), "v22.11.0")
+        self.assertEqual(self.run_mock.call_count, 1)
+
+    def test_volta_shim_is_never_cached(self) -> None:
+        shim = self._binary("volta-shim")
+        node = os.path.join(self.tmp.name, "node-link")
+        os.symlink(shim, node)
+        self.diagnostics._run_cached(ARGV, node, 60)
+        self.diagnostics._run_cached(ARGV, node, 60)
+        self.assertEqual(self.run_mock.call_count, 2)
+
+
+class TestRun(unittest.TestCase):
+    def test_path_checks_overlap_npm_list(self) -> None:
+        diagnostics = NodeDiagnostics(verbose=True)
+        path_checked = threading.Event()
+        check_path_config = diagnostics.check_path_config
+
+        def mark_path_checked() -> Dict[str, Any]:
+            path_checked.set()
+            return check_path_config()
+
+        def npm_list() -> Dict[str, Any]:
+            # Only completes if the PATH section runs while npm list is pending
+            return {"count": 0, "location": "overlapped" if path_checked.wait(5) else "serialized"}
+
+        found = [DiagnosticResult(name, True, version="v22.11.0", path=f"/bin/{name}") for name in ("node", "npm")]
+        with (
+            patch.object(diagnostics, "check_commands", return_value=found + [DiagnosticResult("volta", False)]),
+            patch.object(diagnostics, "check_path_config", side_effect=mark_path_checked),
+            patch.object(diagnostics, "check_npm_global_packages", side_effect=npm_list),
+            patch("sys.stdout", new=io.StringIO()) as output,
+        ):
+            diagnostics.run()
+
+        self.assertIn("Location: overlapped", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,47 +30,100 @@ Philosophy:
 __version__ = "1.0.0"
 __author__ = "Refactored from get_scheduler library"
 
-# Import key components for easy access at package level
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Key components are exposed at package level but loaded lazily (PEP 562),
+# so importing one submodule does not pull in the whole package tree.
+# Maps public name -> submodule that defines it.
+_LAZY_IMPORTS = {
+    # Command execution utilities
+    "CommandConfig": "cmd_utils",
+    "CommandResult": "cmd_utils",
+    "CustomCommandWrapper": "cmd_utils",
+    "DockerCommandWrapper": "cmd_utils",
+    "GitCommandWrapper": "cmd_utils",
+    "KubernetesCommandWrapper": "cmd_utils",
+    "SubprocessClient": "cmd_utils",
+    "SystemCommandWrapper": "cmd_utils",
+    "create_command_wrapper": "cmd_utils",
+    "create_subprocess_client": "cmd_utils",
+    # Core utilities from common module
+    "ErrorInfo": "common",
+    "ErrorPatternDetector": "common",
+    "ErrorPatternSet": "common",
+    "LoggingConfig": "common",
+    "SignalHandler": "common",
+    "create_project_logger": "common",
+    "create_simple_detector": "common",
+    "setup_logging": "common",
+    # I/O utilities
+    "ConsoleWriter": "io_utils",
+    "CSVWriter": "io_utils",
+    "FileValidator": "io_utils",
+    "LogWriter": "io_utils",
+    "MultiFormatWriter": "io_utils",
+    "OutputManager": "io_utils",
+    "create_csv_writer": "io_utils",
+    "create_log_writer": "io_utils",
+    "create_output_manager": "io_utils",
+    "validate_file_operations": "io_utils",
+}
+_SUBMODULES = frozenset(_LAZY_IMPORTS.values())
+
+if TYPE_CHECKING:
+    from .cmd_utils import (
+        CommandConfig,
+        CommandResult,
+        CustomCommandWrapper,
+        DockerCommandWrapper,
+        GitCommandWrapper,
+        KubernetesCommandWrapper,
+        SubprocessClient,
+        SystemCommandWrapper,
+        create_command_wrapper,
+        create_subprocess_client,
+    )
+    from .common import (
+        ErrorInfo,
+        ErrorPatternDetector,
+        ErrorPatternSet,
+        LoggingConfig,
+        SignalHandler,
+        create_project_logger,
+        create_simple_detector,
+        setup_logging,
+    )
+    from .io_utils import (
+        ConsoleWriter,
+        CSVWriter,
+        FileValidator,
+        LogWriter,
+        MultiFormatWriter,
+        OutputManager,
+        create_csv_writer,
+        create_log_writer,
+        create_output_manager,
+        validate_file_operations,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import a package-level export on first access and cache it."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# Command execution utilities
-from .cmd_utils import (
-    CommandConfig,
-    CommandResult,
-    CustomCommandWrapper,
-    DockerCommandWrapper,
-    GitCommandWrapper,
-    KubernetesCommandWrapper,
-    SubprocessClient,
-    SystemCommandWrapper,
-    create_command_wrapper,
-    create_subprocess_client,
-)
 
-# Core utilities from common module
-from .common import (
-    ErrorInfo,
-    ErrorPatternDetector,
-    ErrorPatternSet,
-    LoggingConfig,
-    SignalHandler,
-    create_project_logger,
-    create_simple_detector,
-    setup_logging,
-)
+def __dir__() -> list[str]:
+    """List loaded names together with the lazily loaded exports."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBMODULES)
 
-# I/O utilities
-from .io_utils import (
-    ConsoleWriter,
-    CSVWriter,
-    FileValidator,
-    LogWriter,
-    MultiFormatWriter,
-    OutputManager,
-    create_csv_writer,
-    create_log_writer,
-    create_output_manager,
-    validate_file_operations,
-)
 
 __all__ = [
     # Common utilities
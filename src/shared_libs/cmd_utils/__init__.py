@@ -10,35 +10,82 @@ This module provides robust command execution utilities:
 These utilities standardize external command execution across all projects.
 """
 
-from .command_wrappers import (
-    CustomCommandWrapper,
-    DockerCommandWrapper,
-    GitCommandWrapper,
-    KubernetesCommandWrapper,
-    SystemCommandWrapper,
-    create_command_wrapper,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Command utilities - implemented
-from .subprocess_client import (
-    CommandConfig,
-    CommandResult,
-    ConstantDelayStrategy,
-    ExponentialBackoffStrategy,
-    RetryStrategy,
-    SubprocessClient,
-    create_subprocess_client,
-)
-from .wrapper_manager import (
-    PythonWrapperManager,
-    WrapperError,
-    create_thin_wrapper,
-    setup_bash_environment_integration,
-)
+# Exports are loaded lazily (PEP 562) so that, e.g., importing
+# SubprocessClient does not also import the command wrappers.
+# Maps public name -> submodule that defines it.
+_LAZY_IMPORTS = {
+    # Command wrappers
+    "CustomCommandWrapper": "command_wrappers",
+    "DockerCommandWrapper": "command_wrappers",
+    "GitCommandWrapper": "command_wrappers",
+    "KubernetesCommandWrapper": "command_wrappers",
+    "SystemCommandWrapper": "command_wrappers",
+    "create_command_wrapper": "command_wrappers",
+    # Command utilities - implemented
+    "CommandConfig": "subprocess_client",
+    "CommandResult": "subprocess_client",
+    "ConstantDelayStrategy": "subprocess_client",
+    "ExponentialBackoffStrategy": "subprocess_client",
+    "RetryStrategy": "subprocess_client",
+    "SubprocessClient": "subprocess_client",
+    "create_subprocess_client": "subprocess_client",
+    # Wrapper utilities
+    "PythonWrapperManager": "wrapper_manager",
+    "WrapperError": "wrapper_manager",
+    "create_thin_wrapper": "wrapper_manager",
+    "setup_bash_environment_integration": "wrapper_manager",
+}
+_SUBMODULES = frozenset(_LAZY_IMPORTS.values())
+
+if TYPE_CHECKING:
+    from .command_wrappers import (
+        CustomCommandWrapper,
+        DockerCommandWrapper,
+        GitCommandWrapper,
+        KubernetesCommandWrapper,
+        SystemCommandWrapper,
+        create_command_wrapper,
+    )
+    from .subprocess_client import (
+        CommandConfig,
+        CommandResult,
+        ConstantDelayStrategy,
+        ExponentialBackoffStrategy,
+        RetryStrategy,
+        SubprocessClient,
+        create_subprocess_client,
+    )
+    from .wrapper_manager import (
+        PythonWrapperManager,
+        WrapperError,
+        create_thin_wrapper,
+        setup_bash_environment_integration,
+    )
 
 # Future imports will be added as modules are implemented:
 # from .timeout_manager import TimeoutManager
 
+
+def __getattr__(name: str) -> Any:
+    """Import a package-level export on first access and cache it."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List loaded names together with the lazily loaded exports."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBMODULES)
+
+
 __all__ = [
     # Core subprocess utilities
     "SubprocessClient",
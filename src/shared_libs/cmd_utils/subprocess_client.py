@@ -21,6 +21,11 @@ from ..common.error_handling import ErrorInfo, ErrorPatternDetector
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
+def _verbose_print(message: str) -> None:
+    """Print a verbose line with a single write so concurrent calls never split it."""
+    sys.stdout.write(f"{message}\n")
+
+
 class RetryStrategy(ABC):
     """
     Abstract base class for retry strategies.
@@ -223,9 +228,9 @@ class SubprocessClient:
         cmd_string = " ".join(cmd_list)
 
         if config.verbose:
-            print(f"Executing command: {cmd_string}")
+            _verbose_print(f"Executing command: {cmd_string}")
             if working_dir:
-                print(f"Working directory: {working_dir}")
+                _verbose_print(f"Working directory: {working_dir}")
 
         # Attempt execution with retries
         last_result = None
@@ -240,7 +245,7 @@ class SubprocessClient:
                     delay = config.retry_delay
 
                 if config.verbose:
-                    print(f"Retry attempt {attempt}/{config.retries} (delay: {delay:.2f}s)")
+                    _verbose_print(f"Retry attempt {attempt}/{config.retries} (delay: {delay:.2f}s)")
                 time.sleep(delay)
 
             try:
@@ -270,8 +275,8 @@ class SubprocessClient:
                     error_output = stderr
 
                 if config.verbose:
-                    print(f"Command return code: {process_result.returncode}")
-                    print(f"Output length: {len(output)} characters")
+                    _verbose_print(f"Command return code: {process_result.returncode}")
+                    _verbose_print(f"Output length: {len(output)} characters")
 
                 # Detect error patterns
                 error_info = self.error_detector.detect_error_patterns(output, process_result.returncode, cmd_string)
@@ -297,18 +302,18 @@ class SubprocessClient:
                 if config.retry_strategy:
                     if not config.retry_strategy.should_retry(output, process_result.returncode):
                         if config.verbose:
-                            print("Retry strategy indicates no retry for this error")
+                            _verbose_print("Retry strategy indicates no retry for this error")
                         break
 
                 if config.verbose and error_info.is_error:
-                    print(f"Attempt {attempt + 1} failed: {error_info.message}")
+                    _verbose_print(f"Attempt {attempt + 1} failed: {error_info.message}")
                     if error_info.recoverable and attempt < config.retries:
                         # Calculate next delay for verbose output
                         if config.retry_strategy:
                             next_delay = config.retry_strategy.get_delay(attempt)
                         else:
                             next_delay = config.retry_delay
-                        print(f"Will retry in {next_delay:.2f} seconds...")
+                        _verbose_print(f"Will retry in {next_delay:.2f} seconds...")
 
             except subprocess.TimeoutExpired:
                 execution_time = time.time() - start_time
@@ -331,7 +336,7 @@ class SubprocessClient:
                 )
 
                 if config.verbose:
-                    print(f"Command timed out after {config.timeout} seconds")
+                    _verbose_print(f"Command timed out after {config.timeout} seconds")
 
                 # Retry on timeout if configured
                 if attempt < config.retries:
@@ -361,7 +366,7 @@ class SubprocessClient:
                 )
 
                 if config.verbose:
-                    print(f"Command not found: {cmd_name}")
+                    _verbose_print(f"Command not found: {cmd_name}")
 
                 # Don't retry for command not found
                 break
@@ -387,7 +392,7 @@ class SubprocessClient:
                 )
 
                 if config.verbose:
-                    print(f"Command execution failed: {str(e)}")
+                    _verbose_print(f"Command execution failed: {str(e)}")
 
                 # Retry on general exceptions if configured
                 if attempt < config.retries:
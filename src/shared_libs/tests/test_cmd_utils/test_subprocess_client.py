@@ -221,6 +221,19 @@ class TestSubprocessClientExecuteCommand:
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs["timeout"] == 60
 
+    @patch("subprocess.run")
+    def test_verbose_lines_written_whole(self, mock_run: MagicMock) -> None:
+        """Each verbose line is a single write, so concurrent callers cannot split it."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="out", stderr="")
+
+        client = SubprocessClient(CommandConfig(verbose=True))
+        with patch("sys.stdout") as mock_stdout:
+            client.execute_command(["echo", "hi"])
+
+        writes = [call.args[0] for call in mock_stdout.write.call_args_list]
+        assert writes[0] == "Executing command: echo hi\n"
+        assert all(text.endswith("\n") for text in writes)
+
 
 class TestSubprocessClientRetry:
     """Tests for SubprocessClient retry logic."""
@@ -0,0 +1,88 @@
+"""
+Tests for the lazily loaded package-level exports of shared_libs.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+# Add src directory to path so shared_libs is importable as a package
+src_root = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.insert(0, src_root)
+
+import shared_libs
+from shared_libs import cmd_utils
+
+
+class TestSharedLibsExports:
+    """Tests for names exported from the shared_libs package."""
+
+    def test_lazy_attribute_access(self) -> None:
+        """Package-level names resolve to the objects in their submodules."""
+        from shared_libs.cmd_utils.subprocess_client import SubprocessClient
+        from shared_libs.io_utils.csv_writer import CSVWriter
+
+        assert shared_libs.CSVWriter is CSVWriter
+        assert shared_libs.SubprocessClient is SubprocessClient
+
+    def test_from_import(self) -> None:
+        """Names can be imported from the package directly."""
+        from shared_libs import CSVWriter, setup_logging
+
+        assert CSVWriter.__name__ == "CSVWriter"
+        assert callable(setup_logging)
+
+    def test_star_import_exports_all(self) -> None:
+        """from shared_libs import * binds every name in __all__."""
+        namespace: Dict[str, Any] = {}
+        exec("from shared_libs import *", namespace)
+
+        assert set(shared_libs.__all__) <= set(namespace)
+
+    def test_submodules_are_attributes(self) -> None:
+        """Subpackages are reachable as attributes."""
+        assert shared_libs.io_utils.__name__ == "shared_libs.io_utils"
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names raise AttributeError."""
+        try:
+            shared_libs.NotAnExport
+        except AttributeError as e:
+            assert "NotAnExport" in str(e)
+        else:
+            raise AssertionError("expected AttributeError")
+
+    def test_dir_lists_lazy_exports(self) -> None:
+        """dir() includes exports that have not been loaded yet."""
+        assert set(shared_libs.__all__) <= set(dir(shared_libs))
+
+    def test_import_does_not_load_submodules(self) -> None:
+        """Importing the package alone loads none of its subpackages."""
+        code = "import sys, shared_libs; print(sorted(m for m in sys.modules if m.startswith('shared_libs.')))"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=src_root,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+
+class TestCmdUtilsExports:
+    """Tests for names exported from shared_libs.cmd_utils."""
+
+    def test_lazy_attribute_access(self) -> None:
+        """Package-level names resolve to the objects in their submodules."""
+        from shared_libs.cmd_utils.wrapper_manager import WrapperError
+
+        assert cmd_utils.WrapperError is WrapperError
+
+    def test_star_import_exports_all(self) -> None:
+        """from shared_libs.cmd_utils import * binds every name in __all__."""
+        namespace: Dict[str, Any] = {}
+        exec("from shared_libs.cmd_utils import *", namespace)
+
+        assert set(cmd_utils.__all__) <= set(namespace)